@@ -1,5 +1,5 @@
-import time
 import os
+import re
 import sys
 from datetime import datetime, timedelta
 from selenium import webdriver
@@ -42,11 +42,66 @@ TARGET_PRESS_DICT = {
 # If set to None, it works in default "Incremental Mode" (Stops on first duplicate).
 GP_UNTIL_DATE = "2025-12-26"  # Set to None to disable
 
+# 4. Article Extraction Script
+# Runs in the page and returns {title, body, date} in a single driver round trip.
+# Title and date come from the embedded JSON-LD metadata (headline / ISO datePublished) first,
+# falling back to the DOM (date selectors tried in priority order).
+# The body is always read from #dic_area with image captions / summary box removed.
+EXTRACT_ARTICLE_JS = """
+var ld = {};
+var ldScripts = document.querySelectorAll("script[type='application/ld+json']");
+for (var k = 0; k < ldScripts.length; k++) {
+    try {
+        var meta = JSON.parse(ldScripts[k].textContent);
+        if (Array.isArray(meta)) { meta = meta[0] || {}; }
+        if (meta.headline || meta.datePublished) { ld = meta; break; }
+    } catch (e) {}
+}
+
+var title = ld.headline || null;
+if (!title) {
+    var titleElem = document.querySelector("#title_area > span");
+    title = titleElem ? titleElem.innerText : null;
+}
+
+// Body always comes from the DOM with captions/summary box removed
+// (JSON-LD articleBody may include them, which would skew sentiment scores)
+var body = null;
+var bodyElem = document.querySelector("#dic_area");
+if (bodyElem) {
+    var dirts = bodyElem.querySelectorAll(".img_desc, .media_end_summary");
+    for (var i = 0; i < dirts.length; i++) { dirts[i].remove(); }
+    body = bodyElem.innerText;
+}
+
+var date = ld.datePublished || "";
+var dateSelectors = [
+    ".media_end_head_info_datestamp .media_end_head_info_datestamp_time",
+    ".media_end_head_info_datestamp span",
+    ".t11"
+];
+for (var j = 0; j < dateSelectors.length && !date; j++) {
+    var el = document.querySelector(dateSelectors[j]);
+    if (el) { date = el.innerText; }
+}
+if (!date) {
+    var stamp = document.querySelector(".media_end_head_info_datestamp");
+    if (stamp) { date = stamp.getAttribute("data-date-time") || ""; }
+}
+return {title: title, body: body, date: date};
+"""
+
+# 5. Excluded Domains (entertainment/sports articles are skipped)
+_EXCLUDE_RE = re.compile(r"entertain\.naver\.com|sports\.news\.naver\.com|sports\.naver\.com")
+
 # ==============================================================================
 # [Crawler Class]
 # ==============================================================================
 
 class NewsCrawlerV4:
+    # Labels stripped from Korean date strings in a single pass
+    _DATE_STRIP = re.compile(r"기사입력|입력|오전|오후")
+
     def __init__(self, db_url, press_dict, until_date=None):
         self.db_url = db_url
         self.press_dict = press_dict
@@ -98,10 +153,16 @@ class NewsCrawlerV4:
     
     def clean_date(self, date_str):
         """Parse Naver News date string into YYYY-MM-DD HH:MM:SS format."""
+        # ISO 8601 (JSON-LD datePublished / data-date-time) needs no 오전/오후 handling
+        try:
+            return datetime.fromisoformat(str(date_str).strip()).strftime("%Y-%m-%d %H:%M:%S")
+        except ValueError:
+            pass
+
         try:
-            date_str = str(date_str).replace("기사입력", "").replace("입력", "").strip()
+            date_str = str(date_str)
             is_pm = "오후" in date_str
-            date_str = date_str.replace("오전", "").replace("오후", "").strip()
+            date_str = self._DATE_STRIP.sub("", date_str).strip()
             
             # Format: 2025.12.15. 10:30
             dt = datetime.strptime(date_str, "%Y.%m.%d. %H:%M")
@@ -162,58 +223,29 @@ class NewsCrawlerV4:
         """Navigate to URL and extract title, content, date."""
         try:
             self.driver.get(url)
-            # Efficient wait (Wait less for explicit elements)
-            time.sleep(0.3) 
             
             # Domain Filter
             curr_url = self.driver.current_url
-            if any(x in curr_url for x in ["entertain.naver.com", "sports.news.naver.com", "sports.naver.com"]):
+            if _EXCLUDE_RE.search(curr_url):
                 return None
 
-            # Check validity (Title presence)
+            # Check validity (Title presence) - explicit wait only, returns as soon as the title exists
             try:
                 WebDriverWait(self.driver, 3).until(EC.presence_of_element_located((By.CSS_SELECTOR, "#title_area > span")))
             except TimeoutException:
                 # Retry check for redirect
                 curr_url = self.driver.current_url
-                if any(x in curr_url for x in ["entertain.naver.com", "sports.naver.com"]):
+                if _EXCLUDE_RE.search(curr_url):
                     return None
                 return None
 
-            # 1. Title
-            try: title = self.driver.find_element(By.CSS_SELECTOR, "#title_area > span").text
-            except: title = "제목 없음"
-
-            # 2. Content
-            try:
-                dic_area = self.driver.find_element(By.CSS_SELECTOR, "#dic_area")
-                self.driver.execute_script("""
-                    var element = arguments[0];
-                    var dirts = element.querySelectorAll(".img_desc, .media_end_summary"); 
-                    for (var i = 0; i < dirts.length; i++) { dirts[i].remove(); }
-                """, dic_area)
-                content = dic_area.text.replace("\n", " ").strip()
-            except: content = "본문 없음"
-
-            # 3. Date
-            raw_date = "날짜 없음"
-            date_selectors = [
-                ".media_end_head_info_datestamp .media_end_head_info_datestamp_time",
-                ".media_end_head_info_datestamp span",
-                ".t11"
-            ]
-            for sel in date_selectors:
-                try:
-                    raw_date = self.driver.find_element(By.CSS_SELECTOR, sel).text
-                    if raw_date: break
-                except: continue
-            
-            # If still found nothing, check attribute
-            if raw_date == "날짜 없음":
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, ".media_end_head_info_datestamp")
-                    raw_date = elem.get_attribute("data-date-time")
-                except: pass
+            # 1~3. Title, Content (captions/summary stripped) and Date in one round trip
+            info = self.driver.execute_script(EXTRACT_ARTICLE_JS) or {}
+            title = info.get("title")
+            if title is None: title = "제목 없음"
+            content = info.get("body")
+            content = content.replace("\n", " ").strip() if content is not None else "본문 없음"
+            raw_date = info.get("date") or "날짜 없음"
 
             clean_dt = self.clean_date(raw_date)
             print(f"  ▷ [Scraping] {title[:20]}... ({clean_dt})")
@@ -224,6 +256,13 @@ class NewsCrawlerV4:
             # print(f"[Scraping Error] {e}")
             return None
 
+    def wait_for_list_reload(self, old_elem):
+        """Wait until the clicked page replaces old_elem and the new article list is present."""
+        WebDriverWait(self.driver, 5).until(EC.staleness_of(old_elem))
+        WebDriverWait(self.driver, 8).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, "#main_content > div.list_body"))
+        )
+
     def process_day_press(self, date_str, press_name, oid):
         """Process a single press on a specific date."""
         target_url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={oid}&date={date_str}"
@@ -271,11 +310,13 @@ class NewsCrawlerV4:
             if not article_urls:
                 break # End of pages
 
-            main_window = self.driver.current_window_handle
+            # Articles are opened in this same window, so remember where the list page is
+            list_url = self.driver.current_url
+            left_list_page = False
             
             # B. Process Links
             for url in article_urls:
-                if "entertain.naver.com" in url or "sports.naver.com" in url:
+                if _EXCLUDE_RE.search(url):
                     continue
                 
                 # 1. Check Session Cache (Pagination Shift Protection)
@@ -296,27 +337,28 @@ class NewsCrawlerV4:
                         stop_press = True
                         break
                 
-                # 3. Open & Scrape
-                try:
-                    self.driver.execute_script("window.open('');")
-                    self.driver.switch_to.window(self.driver.window_handles[-1])
-                    
-                    data = self.extract_article_info(url)
-                    
-                    self.driver.close()
-                    self.driver.switch_to.window(main_window)
-                    
-                    if data:
-                        self.insert_article(data, oid)
-                        inserted_count += 1
-                        session_crawled_links.add(url)
+                # 3. Open & Scrape (main window, no extra tab)
+                left_list_page = True
+                data = self.extract_article_info(url)
                 
-                except Exception as e:
-                    print(f"      [!] Tab Error: {e}")
-                    self.driver.switch_to.window(main_window)
+                if data:
+                    self.insert_article(data, oid)
+                    inserted_count += 1
+                    session_crawled_links.add(url)
 
             if stop_press:
                 break
+
+            # Return to the list page only when we need it for paging
+            if left_list_page:
+                try:
+                    self.driver.get(list_url)
+                    WebDriverWait(self.driver, 8).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, "#main_content > div.list_body"))
+                    )
+                except TimeoutException:
+                    print(f"   [!] Failed to reload list page: {list_url}")
+                    break
             
             # C. Next Page Logic
             try:
@@ -329,14 +371,14 @@ class NewsCrawlerV4:
                     next_btn = paging_div.find_element(By.XPATH, f".//a[normalize-space()='{next_num}']")
                     self.driver.execute_script("arguments[0].click();", next_btn)
                     page_count += 1
-                    time.sleep(1.0)
+                    self.wait_for_list_reload(paging_div)
                 except NoSuchElementException:
                     # Try finding 'Next' arrow
                     try:
                         next_arrow = paging_div.find_element(By.CSS_SELECTOR, "a.next")
                         self.driver.execute_script("arguments[0].click();", next_arrow)
                         page_count += 1
-                        time.sleep(1.0)
+                        self.wait_for_list_reload(paging_div)
                     except NoSuchElementException:
                         break # End of pages (No more buttons)
 
@@ -354,7 +396,7 @@ class NewsCrawlerV4:
         self.init_driver()
         
         current_date = datetime.now()
-        active_targets = list(self.press_dict.items())
+        active_targets = dict(self.press_dict)  # {press_name: oid}
         
         print("=======================================================")
         print(f" News Crawler v4 (Oracle) Started at {current_date}")
@@ -376,18 +418,18 @@ class NewsCrawlerV4:
                 
                 finished_targets = []
                 
-                for press_name, oid in active_targets:
+                for press_name, oid in active_targets.items():
                     print(f"   -> [{press_name}] Scanning...")
                     is_stopped, count = self.process_day_press(date_str, press_name, oid)
                     
                     print(f"      Result: {count} inserted.")
                     if is_stopped:
                         print(f"      [COMPLETE] {press_name} is up-to-date.")
-                        finished_targets.append((press_name, oid))
+                        finished_targets.append(press_name)
                 
                 # Remove finished press from active list
-                for ft in finished_targets:
-                    active_targets.remove(ft)
+                for press_name in finished_targets:
+                    active_targets.pop(press_name, None)
                 
                 # Go to yesterday
                 current_date -= timedelta(days=1)
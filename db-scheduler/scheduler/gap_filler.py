@@ -4,11 +4,20 @@ import os
 import sys
 from datetime import datetime
 
+# CUDA 캐싱 할당기 설정 (프로세스 전체 적용 - 산업분류/감성분석 모델 모두 해당)
+# 감성분석의 길이 버킷팅으로 배치마다 텐서 크기가 달라져도 단편화를 억제
+# (expandable_segments로 세그먼트를 늘려 재사용 - 배치마다 torch.cuda.empty_cache()를 호출하지 않음)
+# CUDA 초기화 전에 설정되어야 적용되므로 모델 모듈 임포트 전에 지정
+os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+# Rust(fast) 토크나이저의 배치 인코딩 멀티스레딩 허용
+# (industry_classifier가 transformers를 먼저 임포트하므로 모델 모듈 임포트 전에 지정)
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
 # 스크립트 실행 위치에 따라 모듈 경로 추가 (scheduler 폴더 기준)
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # 커스텀 모듈 임포트
-from news_crawling.Nnews_Crawler_CSV import NewsCrawlerCSV
+from news_crawling.Nnews_Crawler_CSV import NewsCrawlerCSV, decode_content
 from industry_labeling.industry_classifier import IndustryClassifier
 from sentiment_analysis.sentiment_analyzer import NewsSentimentAnalyzer
 
@@ -62,6 +71,9 @@ TARGET_PRESS_DICT = {
     "비즈워치": "648"
 }
 
+# 감성분석 대상 산업군
+TARGET_INDUSTRIES = ["자동차", "건설", "헬스케어"]
+
 # 모델 인스턴스를 전역으로 관리 (Singleton / Lazy Loading)
 classifier = None
 sentiment_analyzer = None
@@ -94,6 +106,33 @@ def init_models():
         except Exception as e:
             print(f"[오류] 감성분석 모델 로드 실패: {e}")
 
+def annotate_batch(titles, contents):
+    """
+    [크롤러 배치 분석]
+    크롤러가 기사 배치를 파일에 기록하기 직전에 호출하여 INDUSTRY / SENT_SCORE를 한 번에 채웁니다.
+    (기사별 모델 호출 대신 배치 단위 추론)
+    :param titles: 제목 리스트
+    :param contents: 본문 리스트 (압축 전 원문)
+    :return: (산업군 리스트, 감성점수 리스트) - 분석하지 못한 항목은 ""
+    """
+    init_models()
+    n = len(titles)
+    industries = [""] * n
+    scores = [""] * n
+
+    if classifier is not None:
+        industries = [label for label, prob in classifier.predict_batch(titles, batch_size=32)]
+
+    if sentiment_analyzer is not None:
+        targets = [i for i, ind in enumerate(industries) if ind in TARGET_INDUSTRIES]
+        if targets:
+            texts = [f"{titles[i]} {(contents[i] or '')[:200]}" for i in targets]
+            # ndarray -> 파이썬 float (JSONL 직렬화 호환)
+            for i, score in zip(targets, sentiment_analyzer.predict_batch(texts, batch_size=32).tolist()):
+                scores[i] = score
+
+    return industries, scores
+
 def get_csv_path():
     """CSV 파일 절대 경로 반환"""
     base = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) # Project1/
@@ -184,12 +223,9 @@ def fill_missing_sentiment(start_date=None, end_date=None):
     if 'SENT_SCORE' not in df.columns:
         df['SENT_SCORE'] = ""
         
-    # 타겟 산업군 정의
-    target_industries = ["자동차", "건설", "헬스케어"]
-    
     # 1. 대상 필터링: 산업군 일치 AND 점수 없음
     # INDUSTRY가 타겟에 포함되어야 함
-    ind_mask = df['INDUSTRY'].isin(target_industries)
+    ind_mask = df['INDUSTRY'].isin(TARGET_INDUSTRIES)
     sent_mask = (df['SENT_SCORE'].isna()) | (df['SENT_SCORE'] == "")
     mask = ind_mask & sent_mask
     
@@ -216,7 +252,7 @@ def fill_missing_sentiment(start_date=None, end_date=None):
     texts = []
     for idx in target_indices:
         title = str(df.at[idx, 'TITLE'])
-        content = str(df.at[idx, 'CONTENT'])
+        content = decode_content(df.at[idx, 'CONTENT'])
         text = f"{title} {content[:200]}"
         texts.append(text)
         
@@ -281,12 +317,15 @@ def run_gap_filler(start_date=None, end_date=None):
         csv_path=csv_path, 
         press_dict=TARGET_PRESS_DICT, 
         start_date=crawler_start,
-        until_date=crawler_until
+        until_date=crawler_until,
+        compress_content=True,
+        annotator=annotate_batch
     )
     crawler.run()
     
     # --------------------------------------------------------------------------
     # Step 2: 산업 분류 (빈 값 채우기)
+    # 크롤링 중 annotate_batch로 채워지며, 여기서는 분석 실패/기존 누락분만 처리
     # --------------------------------------------------------------------------
     print("\n>>> [Step 2] 미분류 데이터 산업 라벨링 시작")
     fill_missing_industry(start_date=use_start, end_date=use_end)
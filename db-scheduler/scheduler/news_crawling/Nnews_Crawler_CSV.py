@@ -1,7 +1,17 @@
-import time
+import asyncio
 import os
+import re
 import sys
-import csv
+import base64
+import hashlib
+import json
+import math
+from collections import OrderedDict
+import httpx
+import lxml.html
+from lxml.cssselect import CSSSelector
+import ujson
+import zstandard as zstd
 import pandas as pd
 from datetime import datetime, timedelta
 from selenium import webdriver
@@ -11,7 +21,125 @@ from selenium.webdriver.chrome.options import Options
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException
+
+# 봇 탐지 방지를 위한 User-Agent (브라우저/HTTP 클라이언트 공용)
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+
+# 상세 페이지 파싱용 선택자 (모듈 로드 시 XPath로 한 번만 컴파일)
+# 여러 후보를 그룹 선택자로 묶어 한 번의 탐색으로 찾고, 내용이 있는 첫 요소를 사용
+ARTICLE_BODY_CSS = "#dic_area, #articeBody, .news_end, #articleBodyContents"
+ARTICLE_DATE_CSS = ".media_end_head_info_datestamp_time, .t11, .info_view .date"
+ARTICLE_BODY_SELECTOR = CSSSelector(ARTICLE_BODY_CSS)
+ARTICLE_DATE_SELECTOR = CSSSelector(ARTICLE_DATE_CSS)
+
+# 목록 페이지 파싱용 선택자 (기사 항목 / 페이징의 현재 페이지 번호)
+LIST_ITEM_SELECTOR = CSSSelector(".list_body ul li")
+LIST_PAGE_SELECTOR = CSSSelector(".paging strong")
+
+# 동시 HTTP 요청 수 (네이버 차단 방지를 위해 제한)
+FETCH_CONCURRENCY = 8
+
+# 언론사별 동시 수집 시작 간격 (초, 같은 도메인에 요청이 한꺼번에 몰리지 않도록)
+PRESS_STAGGER_SEC = 0.1
+
+# 기사 링크에서 (OID, AID) 추출 (n.news.naver.com/mnews/article/009/000... 또는 read.naver?oid=009&aid=000...)
+ARTICLE_ID_RE = re.compile(r"/article/(\d+)/(\d+)|[?&]oid=(\d+).*?[?&]aid=(\d+)")
+
+# 중복 체크용 최근 링크 캐시 크기 (날짜별 목록 특성상 최근 수집분과만 겹침)
+RECENT_LINKS_MAX = 20000
+
+# 기존 CSV 링크를 담는 Bloom Filter 설정 (초기 용량 / 전체 오탐률) 및 CSV 스트리밍 청크 크기
+LINK_FILTER_CAPACITY = 200_000
+LINK_FILTER_ERROR_RATE = 1e-6
+CSV_CHUNK_SIZE = 100_000
+
+# 날짜 파싱 실패 시 기록되는 값
+NO_DATE = "0000-00-00 00:00:00"
+
+# 압축 저장된 CONTENT 셀의 접두어 (접두어가 없으면 평문으로 간주)
+CONTENT_ZSTD_PREFIX = "zstd:"
+
+def decode_content(value):
+    """
+    CSV의 CONTENT 셀을 평문으로 복원 (zstd+base64 압축 셀과 기존 평문 셀 모두 지원)
+    :param value: CSV에서 읽은 CONTENT 값
+    :return: 본문 문자열 (결측치는 빈 문자열)
+    """
+    if not isinstance(value, str):
+        return ""
+    if not value.startswith(CONTENT_ZSTD_PREFIX):
+        return value
+    raw = base64.b64decode(value[len(CONTENT_ZSTD_PREFIX):])
+    return zstd.ZstdDecompressor().decompress(raw).decode('utf-8')
+
+class ScalableBloomFilter:
+    """
+    링크 중복 체크용 확장형 Bloom Filter
+    원본 문자열 대신 비트 배열만 보관하여 수십만 건의 링크도 수 MB로 멤버십 검사가 가능합니다.
+    (오탐(False Positive)은 드물게 있을 수 있으나 미탐은 없음)
+    - 현재 필터가 용량에 도달하면 2배 크기의 필터를 추가하고,
+      i번째 필터의 오탐률을 error_rate * (1/2)^(i+1)로 줄여 전체 오탐률을 error_rate 이하로 유지
+    """
+
+    def __init__(self, initial_capacity=LINK_FILTER_CAPACITY, error_rate=LINK_FILTER_ERROR_RATE):
+        self.initial_capacity = initial_capacity
+        self.error_rate = error_rate
+        self._filters = []  # [비트 배열(bytearray), 비트 수, 해시 수, 용량, 등록 수]
+        self._add_filter()
+
+    def _add_filter(self):
+        i = len(self._filters)
+        capacity = self.initial_capacity * (2 ** i)
+        p = self.error_rate * (0.5 ** (i + 1))
+        num_bits = int(math.ceil(-capacity * math.log(p) / (math.log(2) ** 2)))
+        num_hashes = max(1, int(round(num_bits / capacity * math.log(2))))
+        self._filters.append([bytearray((num_bits + 7) // 8), num_bits, num_hashes, capacity, 0])
+
+    @staticmethod
+    def _hash_pair(key):
+        """blake2b 한 번으로 두 개의 64bit 해시를 얻어 비트 위치 계산에 사용"""
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        return int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little')
+
+    @staticmethod
+    def _positions(f, h1, h2):
+        """
+        비트 위치 num_hashes개 생성 (Enhanced Double Hashing)
+        단순 h1 + i*h2는 h2가 비트 수와 공약수를 가지면 위치가 반복되어 오탐률이 크게 오르므로 증분을 매번 바꿉니다.
+        """
+        num_bits = f[1]
+        x, y = h1 % num_bits, h2 % num_bits
+        for i in range(f[2]):
+            yield x
+            x = (x + y) % num_bits
+            y = (y + i + 1) % num_bits
+
+    @classmethod
+    def _contains(cls, f, h1, h2):
+        bits = f[0]
+        return all(bits[pos >> 3] & (1 << (pos & 7)) for pos in cls._positions(f, h1, h2))
+
+    def __contains__(self, key):
+        h1, h2 = self._hash_pair(key)
+        return any(self._contains(f, h1, h2) for f in self._filters)
+
+    def __len__(self):
+        return sum(f[4] for f in self._filters)
+
+    def add(self, key):
+        """링크 등록 (이미 있는 것으로 판정되면 False)"""
+        h1, h2 = self._hash_pair(key)
+        if any(self._contains(f, h1, h2) for f in self._filters):
+            return False
+        if self._filters[-1][4] >= self._filters[-1][3]:
+            self._add_filter()
+        f = self._filters[-1]
+        bits = f[0]
+        for pos in self._positions(f, h1, h2):
+            bits[pos >> 3] |= 1 << (pos & 7)
+        f[4] += 1
+        return True
 
 # ==============================================================================
 # [뉴스 크롤러 클래스 정의]
@@ -23,7 +151,9 @@ class NewsCrawlerCSV:
     
     [주요 기능]
     1. 날짜별/언론사별 뉴스 기사 수집 (제목, 본문, 링크, 날짜 등)
-    2. 중복 기사 발견 시 해당 언론사의 당일 수집을 즉시 중단 (Incremental Crawling)
+       - 목록/상세 페이지는 비동기 HTTP로 동시 수집하고, 실패한 페이지만 브라우저(Selenium)로 재시도
+    2. 언론사별 북마크(마지막 수집 기사 시각) 도달 시 해당 언론사 수집 종료 (Incremental Crawling)
+       - until_date 지정(Gap Filling) 시에는 기존 링크와 중복되는 기사에서 당일 수집 중단
     3. 수집된 데이터를 CSV 파일에 실시간 저장 (Excel 호환 utf-8-sig)
     
     [사용법]
@@ -31,25 +161,42 @@ class NewsCrawlerCSV:
     crawler.run()
     """
     
-    def __init__(self, csv_path, press_dict, until_date=None, start_date=None):
+    def __init__(self, csv_path, press_dict, until_date=None, start_date=None, compress_content=False, jsonl_path=None,
+                 flush_every=100, annotator=None):
         """
         초기화 함수
         :param csv_path: 저장할 CSV 파일 경로
         :param press_dict: 수집 대상 언론사 딕셔너리 {이름: OID}
         :param until_date: 수집 종료 기준 날짜 (이 날짜 이전 데이터는 수집 안 함, None이면 중복 발견 시까지)
         :param start_date: 수집 시작 날짜 (None이면 오늘부터)
+        :param compress_content: True면 CONTENT를 zstd 압축 + base64로 저장 (읽을 때는 decode_content 사용)
+        :param jsonl_path: 지정 시 수집 중에는 JSON Lines 파일에 기록하고, 종료(close) 시 CSV로 한 번에 변환
+        :param flush_every: 메모리에 모아둔 기사가 이 개수에 도달하면 파일에 일괄 기록
+        :param annotator: 지정 시 기록 직전 배치 단위로 호출되는 함수
+                          annotator(titles, contents) -> (industries, sent_scores)
         """
         self.csv_path = csv_path
         self.press_dict = press_dict
         self.until_date = until_date
         self.start_date = start_date
+        self.jsonl_path = jsonl_path
+        self.flush_every = flush_every
+        self.annotator = annotator
+        self._cctx = zstd.ZstdCompressor(level=3) if compress_content else None
         
         self.driver = None
+        self._http = None  # 목록/상세 페이지 수집용 비동기 HTTP 클라이언트 (첫 요청 시 생성)
+        self._sem = None   # 동시 요청 수 제한 (클라이언트와 함께 생성)
         self.limit_dt = None
-        self.existing_links = set()
+        self._recent_links = OrderedDict()  # 이번 실행에서 수집한 링크 LRU (크기 RECENT_LINKS_MAX 고정)
+        self._link_filter = ScalableBloomFilter()  # 기존 CSV + 수집 링크 전체 (멤버십 검사 전용)
+        self._csv_fh = None  # 바이너리 append 핸들 (첫 저장 시 오픈)
+        self._jsonl_fh = None  # JSON Lines append 핸들 (jsonl_path 사용 시)
         
         # CSV 저장 컬럼 정의
         self.fieldnames = ["NDATE", "TITLE", "CONTENT", "LINK", "OID", "INDUSTRY", "SENT_SCORE"]
+        # 미기록 기사 버퍼 (컬럼별 리스트, flush_rows에서 일괄 기록)
+        self._cols = {k: [] for k in self.fieldnames}
         
         # 날짜 제한 파싱
         if self.until_date:
@@ -59,9 +206,20 @@ class NewsCrawlerCSV:
                 print(f"[오류] 날짜 형식이 올바르지 않습니다: {self.until_date}. (YYYY-MM-DD 권장)")
                 sys.exit(1)
 
+        # 언론사별 북마크 {OID: 마지막 수집 기사 NDATE} (CSV 옆 JSON 파일)
+        self.bookmark_path = os.path.splitext(self.csv_path)[0] + ".bookmarks.json"
+        self._bookmarks = self.load_bookmarks()
+        self._pending_bookmarks = {}  # 이번 실행에서 수집 중인 언론사의 최신 기사 시각 (완료 시 반영)
+
+        # 이전 실행에서 비정상 종료로 남은 JSONL이 있으면 먼저 CSV에 반영
+        self.convert_jsonl_to_csv()
+
         # 기존 데이터 로드 (중복 체크용)
         self.load_existing_links()
 
+        # 이번 실행의 중단 기준 (실행 중 갱신되는 북마크와 분리, Incremental 모드에서만 사용)
+        self._stop_at = dict(self._bookmarks) if self.limit_dt is None else {}
+
     # ==========================================================================
     # [설정 및 리소스 관리]
     # ==========================================================================
@@ -75,17 +233,33 @@ class NewsCrawlerCSV:
         chrome_options.add_argument("--disable-dev-shm-usage") # Shared Memory 사용 안함 (Docker/Linux 환경 대응)
         chrome_options.add_argument("--window-size=1920,1080")
         # 봇 탐지 방지를 위한 User-Agent 설정
-        chrome_options.add_argument("user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
+        chrome_options.add_argument(f"user-agent={USER_AGENT}")
         
         try:
             self.driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()), options=chrome_options)
+            # 네이버 메인을 한 번 열어 DNS/쿠키를 미리 확보 (이후 목록 페이지 첫 로드 지연 감소)
+            self.driver.get("https://news.naver.com/")
             print("[시스템] 브라우저 로드 완료.")
         except Exception as e:
             print(f"[오류] 드라이버 초기화 실패: {e}")
             sys.exit(1)
 
+    def get_driver(self):
+        """브라우저가 필요한 경우(대체 수집)에만 드라이버를 띄워 반환"""
+        if self.driver is None:
+            self.init_driver()
+        return self.driver
+
     def close(self):
         """리소스 정리 및 브라우저 종료"""
+        self.flush_rows()
+        if self._csv_fh:
+            self._csv_fh.close()
+            self._csv_fh = None
+        if self._jsonl_fh:
+            self._jsonl_fh.close()
+            self._jsonl_fh = None
+            self.convert_jsonl_to_csv()
         if self.driver:
             self.driver.quit()
         print("[시스템] 크롤러 종료 및 리소스 해제.")
@@ -95,45 +269,203 @@ class NewsCrawlerCSV:
     # ==========================================================================
 
     def load_existing_links(self):
-        """기존 CSV 파일을 읽어 이미 수집된 기사 링크를 메모리에 로드 (중복 방지)"""
+        """
+        기존 CSV 파일을 청크 단위로 읽어 수집된 기사 링크를 Bloom Filter에 등록 (중복 방지)
+        Incremental 모드에서 북마크가 있으면 북마크로 중단 시점을 판단하므로,
+        북마크보다 최신인 기사(이전 실행이 언론사 수집 완료 전에 중단되어 기록만 된 기사)의 링크만 등록합니다.
+        """
         print(f"[시스템] 타겟 CSV: {self.csv_path}")
         
         if not os.path.exists(self.csv_path):
             print("[시스템] CSV 파일이 없어 새로 생성합니다.")
             try:
-                # utf-8-sig: 엑셀에서 한글 깨짐 방지
-                with open(self.csv_path, 'w', encoding='utf-8-sig', newline='') as f:
-                    writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                    writer.writeheader()
+                # utf-8-sig: 엑셀에서 한글 깨짐 방지 (BOM + 헤더를 직접 기록)
+                with open(self.csv_path, 'wb') as f:
+                    f.write(self._encode_header())
             except Exception as e:
                 print(f"[오류] CSV 생성 실패: {e}")
         else:
-            print("[시스템] 기존 CSV 파일에 이어서 수집합니다.")
+            # 북마크 기준 증분 수집이면 북마크 이후 기사 링크만 필터에 등록
+            after_bookmark = self.limit_dt is None and bool(self._bookmarks)
+            if after_bookmark:
+                print(f"[시스템] 북마크 기준 증분 수집 ({len(self._bookmarks)}개 언론사, 북마크 이후 링크만 로드).")
+            else:
+                print("[시스템] 기존 CSV 파일에 이어서 수집합니다.")
             try:
-                df = pd.read_csv(self.csv_path)
-                # 'LINK' 컬럼이 있는 경우만 로드
-                if 'LINK' in df.columns:
-                    self.existing_links = set(df['LINK'].dropna().unique())
-                print(f"[정보] 기존 수집 기사 수: {len(self.existing_links)}개")
+                # 북마크 파일이 없으면 CSV에서 언론사별 최신 기사 시각으로 초기화 (최초 1회)
+                seed_bookmarks = not self._bookmarks
+                latest = {}
+
+                # 전체를 DataFrame으로 올리지 않고 필요한 컬럼만 청크 단위로 스트리밍
+                reader = pd.read_csv(self.csv_path, usecols=lambda c: c in ("NDATE", "LINK", "OID"),
+                                     dtype=str, chunksize=CSV_CHUNK_SIZE)
+                for chunk in reader:
+                    # 'LINK' 컬럼이 있는 경우만 로드
+                    if 'LINK' in chunk.columns:
+                        links = chunk['LINK']
+                        if after_bookmark and {'NDATE', 'OID'} <= set(chunk.columns):
+                            # 언론사별 북마크 시각보다 최신인 행만 (북마크가 없는 언론사/날짜 미상 행은 전부)
+                            ndate = chunk['NDATE'].fillna(NO_DATE)
+                            stop_at = chunk['OID'].str.zfill(3).map(self._bookmarks).fillna("")
+                            links = links[(ndate > stop_at) | (ndate == NO_DATE)]
+                        for link in links.dropna():
+                            self._link_filter.add(link)
+
+                    if seed_bookmarks and {'NDATE', 'OID'} <= set(chunk.columns):
+                        valid = chunk[chunk['NDATE'].notna() & (chunk['NDATE'] != NO_DATE)]
+                        for oid, ndate in valid.groupby(valid['OID'].str.zfill(3))['NDATE'].max().items():
+                            if ndate > latest.get(oid, ""):
+                                latest[oid] = ndate
+
+                print(f"[정보] 중복 체크 등록 링크 수: {len(self._link_filter)}개")
+                if seed_bookmarks:
+                    self._bookmarks = latest
             except Exception as e:
                 print(f"[경고] 기존 CSV 읽기 실패 (덮어쓰기 될 수 있음): {e}")
 
-    def save_to_csv(self, article_data):
+    def _is_seen(self, link):
+        """수집된 링크 여부 확인 (최근 링크 LRU를 먼저 확인하고, 없으면 Bloom Filter 확인)"""
+        if link in self._recent_links:
+            self._recent_links.move_to_end(link)
+            return True
+        return link in self._link_filter
+
+    def _remember_link(self, link):
+        """수집 링크 등록 (LRU 용량 초과 시 가장 오래된 링크 제거, Bloom Filter에는 계속 유지)"""
+        self._link_filter.add(link)
+        self._recent_links[link] = None
+        self._recent_links.move_to_end(link)
+        if len(self._recent_links) > RECENT_LINKS_MAX:
+            self._recent_links.popitem(last=False)
+
+    def load_bookmarks(self):
+        """북마크 파일 로드 (없거나 손상되었으면 빈 딕셔너리)"""
+        if not os.path.exists(self.bookmark_path):
+            return {}
+        try:
+            with open(self.bookmark_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"[경고] 북마크 파일 읽기 실패 (CSV 기준으로 재생성): {e}")
+            return {}
+
+    def save_bookmarks(self):
+        """북마크 파일 저장 (임시 파일에 쓴 뒤 교체하여 중간 손상 방지)"""
+        tmp_path = self.bookmark_path + ".tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._bookmarks, f, ensure_ascii=False, indent=2)
+            os.replace(tmp_path, self.bookmark_path)
+        except Exception as e:
+            print(f"[오류] 북마크 저장 실패: {e}")
+
+    def _encode_row(self, values):
         """
-        단일 기사 데이터를 CSV에 추가 (Append Mode)
+        한 행의 값들을 CSV 한 줄(bytes)로 인코딩 (fieldnames 순서)
+        모든 값을 큰따옴표로 감싸고 내부 따옴표는 두 번 써서 이스케이프 (csv 모듈과 호환)
+        """
+        line = ",".join('"' + str(v).replace('"', '""') + '"' for v in values)
+        return (line + "\r\n").encode('utf-8')
+
+    def _encode_header(self):
+        """BOM(utf-8-sig) + 헤더 행"""
+        return b'\xef\xbb\xbf' + self._encode_row(self.fieldnames)
+
+    def save_row(self, article_data):
+        """
+        단일 기사 데이터를 컬럼별 버퍼에 추가하고, flush_every개가 모이면 일괄 기록
         :param article_data: 기사 정보 딕셔너리
         """
         if not article_data:
             return
 
+        # 누락된 필드는 빈 값으로 처리
+        for k, col in self._cols.items():
+            col.append(article_data.get(k, ""))
+
+        if len(self._cols["LINK"]) >= self.flush_every:
+            self.flush_rows()
+
+    def flush_rows(self):
+        """
+        버퍼에 모인 기사들을 파일에 한 번의 write로 기록 (Append Mode)
+        - 기본: 미리 인코딩한 CSV bytes를 크롤러 수명 동안 유지되는 버퍼드 바이너리 핸들에 기록
+          (텍스트 계층(TextIOWrapper)의 증분 인코더를 거치지 않음)
+        - jsonl_path 지정 시: CSV 이스케이프 없이 JSON Lines로 기록 후 close()에서 CSV로 일괄 변환
+        - 배치마다 핸들을 flush하여 비정상 종료 시 유실 범위를 한 배치(flush_every)로 제한
+        """
+        if not self._cols["LINK"]:
+            return
+
+        # 산업분류/감성분석 (압축 전 원문으로 배치 추론, 실패해도 기사는 빈 값으로 저장)
+        if self.annotator:
+            try:
+                industries, scores = self.annotator(self._cols["TITLE"], self._cols["CONTENT"])
+                self._cols["INDUSTRY"] = list(industries)
+                self._cols["SENT_SCORE"] = list(scores)
+            except Exception as e:
+                print(f"[경고] 배치 분석 실패 (빈 값으로 저장): {e}")
+
         try:
-            with open(self.csv_path, 'a', encoding='utf-8-sig', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.fieldnames)
-                # 누락된 필드는 빈 값으로 처리
-                row = {k: article_data.get(k, "") for k in self.fieldnames}
-                writer.writerow(row)
+            # 본문 압축 (CSV 용량 및 재시작 시 로드 시간 절감)
+            if self._cctx:
+                self._cols["CONTENT"] = [
+                    CONTENT_ZSTD_PREFIX + base64.b64encode(self._cctx.compress(c.encode('utf-8'))).decode('ascii') if c else c
+                    for c in self._cols["CONTENT"]
+                ]
+
+            rows = zip(*(self._cols[k] for k in self.fieldnames))
+
+            if self.jsonl_path:
+                if self._jsonl_fh is None:
+                    self._jsonl_fh = open(self.jsonl_path, 'ab', buffering=1 << 20)
+                self._jsonl_fh.write(b"".join(
+                    ujson.dumps(dict(zip(self.fieldnames, r)), ensure_ascii=False).encode('utf-8') + b'\n'
+                    for r in rows
+                ))
+                self._jsonl_fh.flush()
+                return
+
+            if self._csv_fh is None:
+                self._csv_fh = open(self.csv_path, 'ab', buffering=1 << 20)
+                # 빈 파일이면 BOM + 헤더부터 기록
+                if self._csv_fh.tell() == 0:
+                    self._csv_fh.write(self._encode_header())
+            self._csv_fh.write(b"".join(self._encode_row(r) for r in rows))
+            self._csv_fh.flush()
         except Exception as e:
-            print(f"[오류] CSV 저장 실패: {e}")
+            print(f"[오류] 기사 저장 실패: {e}")
+        finally:
+            for col in self._cols.values():
+                col.clear()
+
+    def sync_rows(self):
+        """
+        버퍼를 기록하고 디스크까지 동기화 (fsync)
+        기사마다가 아니라 하루치 언론사 수집이 끝날 때만 호출하여, 북마크 저장 전에 해당 기사들이 확실히 남도록 합니다.
+        """
+        self.flush_rows()
+        for fh in (self._csv_fh, self._jsonl_fh):
+            if fh:
+                try:
+                    os.fsync(fh.fileno())
+                except OSError as e:
+                    print(f"[경고] 파일 동기화 실패: {e}")
+
+    def convert_jsonl_to_csv(self):
+        """JSON Lines 임시 파일을 CSV에 일괄 추가한 뒤 비웁니다."""
+        if not self.jsonl_path or not os.path.exists(self.jsonl_path) or os.path.getsize(self.jsonl_path) == 0:
+            return
+        try:
+            df = pd.read_json(self.jsonl_path, lines=True, dtype=False, convert_dates=False)
+            df = df.reindex(columns=self.fieldnames)
+            write_header = not os.path.exists(self.csv_path) or os.path.getsize(self.csv_path) == 0
+            df.to_csv(self.csv_path, mode='a', header=write_header, index=False, encoding='utf-8-sig')
+            # 변환 완료 후 임시 파일 비우기 (중복 반영 방지)
+            open(self.jsonl_path, 'wb').close()
+            print(f"[시스템] JSONL -> CSV 변환 완료: {len(df)}건")
+        except Exception as e:
+            print(f"[오류] JSONL -> CSV 변환 실패 (임시 파일 유지: {self.jsonl_path}): {e}")
 
     # ==========================================================================
     # [크롤링 핵심 로직]
@@ -142,9 +474,13 @@ class NewsCrawlerCSV:
     def clean_date(self, date_text):
         """
         네이버 뉴스 날짜 형식 파싱 ('2023.01.01. 오후 1:23' 등)
-        :return: 'YYYY-MM-DD HH:MM:SS' 또는 실패 시 '0000-00-00 00:00:00'
+        :return: 'YYYY-MM-DD HH:MM:SS' 또는 실패 시 NO_DATE
         """
         try:
+            # 모바일 페이지의 data-date-time 속성은 이미 'YYYY-MM-DD HH:MM:SS' 형식
+            if re.fullmatch(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}", date_text):
+                return date_text
+
             if "오전" in date_text or "오후" in date_text:
                 parts = date_text.split(" ")
                 ampm = parts[2]
@@ -170,51 +506,119 @@ class NewsCrawlerCSV:
                 return dt.strftime("%Y-%m-%d %H:%M:%S")
 
         except Exception:
-            return "0000-00-00 00:00:00"
+            return NO_DATE
 
-    def get_article_content(self, link):
+    def get_http_client(self):
+        """
+        목록/상세 페이지 수집용 httpx.AsyncClient 반환 (Lazy 생성, 이벤트 루프 안에서 호출)
+        하나의 클라이언트를 재사용하여 요청마다 TCP/TLS 핸드셰이크를 반복하지 않도록 연결을 유지합니다.
+        """
+        if self._http is None:
+            self._http = httpx.AsyncClient(
+                headers={"User-Agent": USER_AGENT},
+                timeout=5.0,
+                follow_redirects=True,
+                limits=httpx.Limits(max_connections=FETCH_CONCURRENCY, max_keepalive_connections=FETCH_CONCURRENCY)
+            )
+            self._sem = asyncio.Semaphore(FETCH_CONCURRENCY)
+        return self._http
+
+    async def close_http_client(self):
+        """비동기 HTTP 클라이언트 종료 (이벤트 루프가 닫히기 전에 호출)"""
+        if self._http:
+            await self._http.aclose()
+            self._http = None
+            self._sem = None
+
+    async def fetch_html(self, url):
+        """
+        URL을 받아 lxml 트리로 반환 (동시 요청 수 제한, 실패 시 예외)
+        :param url: 요청 URL
+        """
+        client = self.get_http_client()
+        async with self._sem:
+            resp = await client.get(url)
+        resp.raise_for_status()
+        return lxml.html.fromstring(resp.content, base_url=str(resp.url))
+
+    @staticmethod
+    def parse_list_page(tree):
+        """
+        목록 페이지에서 기사 링크/제목과 현재 페이지 번호 추출
+        :param tree: base_url이 지정된 lxml 트리
+        :return: ([(링크, 제목), ...], 현재 페이지 번호 문자열)
+        """
+        tree.make_links_absolute()
+        entries = []
+        for li in LIST_ITEM_SELECTOR(tree):
+            a = li.find(".//a")
+            if a is None or not a.get("href"):
+                continue
+            title = a.text_content().strip()
+            if not title: # 이미지가 링크인 경우 대비
+                img = a.find(".//img")
+                title = (img.get("alt") or "").strip() if img is not None else ""
+                if not title:
+                    continue
+            entries.append((a.get("href"), title))
+
+        strong = LIST_PAGE_SELECTOR(tree)
+        current_page = strong[0].text_content().strip() if strong else "1"
+        return entries, current_page
+
+    async def get_list_page(self, url):
+        """목록 페이지를 HTTP로 받아 파싱하고, 실패한 경우에만 브라우저로 재시도"""
+        try:
+            return self.parse_list_page(await self.fetch_html(url))
+        except Exception:
+            driver = self.get_driver()
+            driver.get(url)
+            return self.parse_list_page(lxml.html.fromstring(driver.page_source, base_url=url))
+
+    @staticmethod
+    def to_mobile_url(link):
+        """
+        기사 링크를 모바일 정적 HTML 주소(https://n.news.naver.com/article/{oid}/{aid})로 변환
+        :return: 변환된 URL (OID/AID를 찾지 못하면 원본 링크)
+        """
+        m = ARTICLE_ID_RE.search(link)
+        if not m:
+            return link
+        oid, aid = (m.group(1), m.group(2)) if m.group(1) else (m.group(3), m.group(4))
+        return f"https://n.news.naver.com/article/{oid}/{aid}"
+
+    async def get_article_content(self, link):
         """
         기사 상세 페이지에서 본문과 날짜 추출
+        JS 렌더링이 필요 없는 모바일 HTML을 HTTP로 받아 파싱하고, 실패한 경우에만 브라우저로 재시도합니다.
         :param link: 기사 URL
         :return: (본문, 날짜문자열)
         """
+        content, date_str = await self._get_article_content_http(link)
+        if content is None:
+            content, date_str = self._get_article_content_driver(link)
+        return content, date_str
+
+    async def _get_article_content_http(self, link):
+        """모바일 HTML + lxml 파싱으로 (본문, 날짜) 추출, 실패 시 (None, None)"""
         try:
-            self.driver.get(link)
+            tree = await self.fetch_html(self.to_mobile_url(link))
             
-            # 본문 추출 시도 (selector 목록 순회)
-            content = ""
-            selectors = ["#dic_area", "#articeBody", ".news_end", "#articleBodyContents"]
-            for sel in selectors:
-                try:
-                    elem = self.driver.find_element(By.CSS_SELECTOR, sel)
-                    content = elem.text.strip()
-                    if content: break
-                except:
-                    continue
+            # 본문 추출 (후보 선택자 중 내용이 있는 첫 요소)
+            content = next((t for t in (e.text_content().strip() for e in ARTICLE_BODY_SELECTOR(tree)) if t), "")
             
             # 본문이 너무 짧으면 실패로 간주
             if not content or len(content) < 10:
                 return None, None
 
-            # 날짜 추출 시도
-            date_str = "0000-00-00 00:00:00"
-            date_selectors = [
-                ".media_end_head_info_datestamp_time",
-                ".t11",
-                ".info_view .date"
-            ]
-            for d_sel in date_selectors:
-                try:
-                    d_elem = self.driver.find_element(By.CSS_SELECTOR, d_sel)
-                    raw_date = d_elem.get_attribute("data-date-time") # 속성 먼저 확인
-                    if not raw_date:
-                        raw_date = d_elem.text.strip()
-                    
-                    if raw_date:
-                        date_str = self.clean_date(raw_date)
-                        break
-                except:
-                    continue
+            # 날짜 추출 (data-date-time 속성 우선, 없으면 텍스트)
+            date_str = NO_DATE
+            raw_date = next(
+                (d for d in ((e.get("data-date-time") or e.text_content().strip()) for e in ARTICLE_DATE_SELECTOR(tree)) if d),
+                None
+            )
+            if raw_date:
+                date_str = self.clean_date(raw_date)
                     
             return content, date_str
 
@@ -222,105 +626,106 @@ class NewsCrawlerCSV:
             # print(f"[경고] 상세 페이지 로드 실패 ({link}): {e}")
             return None, None
 
-    def process_day_press(self, target_date_str, press_name, oid):
+    def _get_article_content_driver(self, link):
+        """[Fallback] 브라우저로 상세 페이지를 열어 (본문, 날짜) 추출, 실패 시 (None, None)"""
+        try:
+            driver = self.get_driver()
+            driver.get(link)
+
+            elems = driver.find_elements(By.CSS_SELECTOR, ARTICLE_BODY_CSS)
+            content = next((t for t in (e.text.strip() for e in elems) if t), "")
+            if not content or len(content) < 10:
+                return None, None
+
+            date_str = NO_DATE
+            d_elems = driver.find_elements(By.CSS_SELECTOR, ARTICLE_DATE_CSS)
+            raw_date = next((d for d in ((e.get_attribute("data-date-time") or e.text.strip()) for e in d_elems) if d), None)
+            if raw_date:
+                date_str = self.clean_date(raw_date)
+
+            return content, date_str
+
+        except Exception:
+            return None, None
+
+    async def process_day_press(self, target_date_str, press_name, oid):
         """
         특정 날짜, 특정 언론사의 기사 목록을 순회하며 수집
+        목록은 페이지 순서대로 받고, 각 페이지의 상세 기사들은 동시에 요청합니다.
         :param target_date_str: 'YYYYMMDD'
         :param press_name: 언론사 이름
         :param oid: 언론사 ID
-        :return: bool (중복 발견으로 인한 중단 여부)
+        :return: bool (중복 또는 북마크 도달로 인한 중단 여부)
         """
         # 네이버 뉴스 리스트 URL (지면 기사 위주)
-        url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={oid}&date={target_date_str}"
-        self.driver.get(url)
-        
+        base_url = f"https://news.naver.com/main/list.naver?mode=LPOD&mid=sec&oid={oid}&date={target_date_str}"
         page = 1
-        stop_crawling = False
         
         while True:
             try:
-                # 기사 목록 요소 추출
-                articles = self.driver.find_elements(By.CSS_SELECTOR, ".list_body ul li")
+                entries, current_page = await self.get_list_page(f"{base_url}&page={page}")
                 
-                # 페이지 내 기사가 없으면 종료 (마지막 페이지)
-                if not articles:
+                # 페이지 내 기사가 없거나, 마지막 페이지를 넘겨 마지막 페이지가 다시 표시되면 종료
+                if not entries or current_page != str(page):
                     break
 
-                for art in articles:
-                    try:
-                        # 링크 및 제목 추출
-                        link_elem = art.find_element(By.TAG_NAME, "a")
-                        link = link_elem.get_attribute("href")
-                        title = link_elem.text.strip()
-                        
-                        if not title: # 이미지가 링크인 경우 대비
-                            try:
-                                title = link_elem.find_element(By.TAG_NAME, "img").get_attribute("alt")
-                            except:
-                                continue
-
-                        # 1. 중복 확인 (이미 수집된 링크면 즉시 중단)
-                        if link in self.existing_links:
-                            print(f"  [중복] 이미 수집된 기사 발견. {press_name} ({target_date_str}) 수집 종료.")
-                            return True # 중단 신호 리턴
-
-                        # 2. 본문 상세 수집
-                        content, rdate = self.get_article_content(link)
-                        
-                        if content:
-                            article_data = {
-                                "NDATE": rdate,
-                                "TITLE": title,
-                                "CONTENT": content,
-                                "LINK": link,
-                                "OID": oid,
-                                "INDUSTRY": "",     # 추후 AI로 채움
-                                "SENT_SCORE": ""    # 추후 AI로 채움
-                            }
-                            
-                            # CSV 저장 및 메모리 업데이트
-                            self.save_to_csv(article_data)
-                            self.existing_links.add(link)
-                            
-                        # 네이버 차단 방지 딜레이
-                        time.sleep(0.3)
-                        
-                        # 목록 페이지로 복귀 (get_article_content에서 페이지 이동했으므로)
-                        self.driver.back()
+                # 1. 중복 확인 (이미 수집된 링크부터는 상세 요청 안 함)
+                # 북마크가 있는 언론사는 북마크 시각으로 중단하므로, 이전 실행이 중간에 끊겨 기록된 기사만 건너뜀
+                if self._stop_at.get(oid):
+                    dup_at = None
+                    entries = [(link, title) for link, title in entries if not self._is_seen(link)]
+                else:
+                    dup_at = next((i for i, (link, _) in enumerate(entries) if self._is_seen(link)), None)
+                    if dup_at is not None:
+                        entries = entries[:dup_at]
+
+                # 2. 본문 상세 수집 (페이지 내 기사 동시 요청)
+                details = await asyncio.gather(*(self.get_article_content(link) for link, _ in entries))
+
+                for (link, title), (content, rdate) in zip(entries, details):
+                    # 3. 북마크 확인 (목록은 최신순이므로 지난 실행의 마지막 수집 시각 이하면 이후는 모두 수집된 기사)
+                    stop_at = self._stop_at.get(oid)
+                    if content and stop_at and rdate != NO_DATE and rdate <= stop_at:
+                        print(f"  [북마크] 이전 수집 시점({stop_at}) 도달. {press_name} ({target_date_str}) 수집 종료.")
+                        return True
+                    
+                    if content:
+                        article_data = {
+                            "NDATE": rdate,
+                            "TITLE": title,
+                            "CONTENT": content,
+                            "LINK": link,
+                            "OID": oid,
+                            "INDUSTRY": "",     # flush 시 annotator가 채움 (없으면 gap_filler에서 채움)
+                            "SENT_SCORE": ""    # flush 시 annotator가 채움 (없으면 gap_filler에서 채움)
+                        }
                         
-                        # [중요] 페이지 복귀 후 요소 다시 참조해야 StaleElementReferenceException 방지
-                        # 하지만 리스트를 다시 로드하려면 비효율적이므로, 
-                        # 여기서는 목록 페이지를 다시 get 하는 방식이 안전함.
-                        # 다만 속도 저하가 있으므로, 새 탭을 여는 방식이 좋으나 여기서는 간단히 다시 로드 안함.
-                        # (driver.back() 만으로 DOM이 유지된다고 가정하거나, 에러 시 재시도 로직 필요)
-                        # 안정성을 위해 목록 페이지 URL을 다시 로드 (가장 확실)
-                        # self.driver.get(current_list_url) -> 페이지네이션 상태 유지 필요
-
-                    except Exception:
-                        continue
-                
+                        # CSV 저장 및 메모리 업데이트
+                        self.save_row(article_data)
+                        self._remember_link(link)
+
+                        # 북마크 갱신 (Incremental 모드만, 저장은 언론사 수집 완료 시)
+                        if self.limit_dt is None and rdate != NO_DATE:
+                            self._pending_bookmarks[oid] = max(self._pending_bookmarks.get(oid, rdate), rdate)
+
+                if dup_at is not None:
+                    print(f"  [중복] 이미 수집된 기사 발견. {press_name} ({target_date_str}) 수집 종료.")
+                    return True # 중단 신호 리턴
+
                 # 다음 페이지 이동
-                # '다음' 버튼이나 현재 페이지 + 1 버튼 찾기
                 page += 1
-                try:
-                    next_page_elem = self.driver.find_element(By.LINK_TEXT, str(page))
-                    next_page_elem.click()
-                    time.sleep(0.5)
-                except NoSuchElementException:
-                    # 다음 페이지 번호가 없으면 '다음' 버튼 확인 (11페이지 이상인 경우)
-                    try:
-                        next_btn = self.driver.find_element(By.CLASS_NAME, "next")
-                        next_btn.click()
-                        time.sleep(0.5)
-                    except:
-                        # 더 이상 페이지 없음
-                        break
                         
             except Exception as e:
                 print(f"[오류] 목록 처리 중 에러 ({press_name} p.{page}): {e}")
                 break
                 
-        return stop_crawling
+        return False
+
+    async def _process_press_staggered(self, delay, target_date_str, press_name, oid):
+        """delay초 뒤에 process_day_press 실행 (언론사 동시 수집 시 시작 시점 분산)"""
+        await asyncio.sleep(delay)
+        print(f"   - {press_name} (OID: {oid}) 탐색...")
+        return await self.process_day_press(target_date_str, press_name, oid)
 
     # ==========================================================================
     # [메인 실행 함수]
@@ -331,8 +736,17 @@ class NewsCrawlerCSV:
         크롤링 전체 프로세스 실행
         오늘(혹은 start_date)부터 과거로 날짜를 하루씩 줄여가며 press_dict의 모든 언론사를 탐색
         """
-        self.init_driver()
-        
+        try:
+            asyncio.run(self._crawl())
+        except KeyboardInterrupt:
+            print("\n[사용자 중단] 크롤링을 강제 종료합니다.")
+        except Exception as e:
+            print(f"[시스템 오류] {e}")
+        finally:
+            self.close()
+
+    async def _crawl(self):
+        """run()의 이벤트 루프 본체 (날짜/언론사 순회)"""
         # 시작 날짜 설정 (기본값: 현재 시각)
         if self.start_date:
             try:
@@ -345,47 +759,53 @@ class NewsCrawlerCSV:
 
         print(f"=== 뉴스 크롤링 시작 (Start: {current_date.strftime('%Y-%m-%d')}) ===")
         
+        # 수집 대상 언론사 {이름: OID} (Incremental 모드에서는 수집이 끝난 언론사를 제외)
+        active_press = dict(self.press_dict)
+
         try:
-            while True:
+            while active_press:
                 # 날짜 제한 체크 (limit_dt보다 과거로 가면 전체 종료)
                 if self.limit_dt and current_date < self.limit_dt:
                     print(f"[종료] 설정된 날짜 한계({self.until_date})에 도달했습니다.")
                     break
                 
                 target_date_str = current_date.strftime("%Y%m%d")
-                print(f"\n>>> [날짜: {target_date_str}] 크롤링 진행 중...")
+                print(f"\n>>> [날짜: {target_date_str}] 크롤링 진행 중... (대상 언론사: {len(active_press)}개)")
                 
-                # 모든 언론사 순회
-                all_press_stopped = True # 모든 언론사에서 중복 발견 시 날짜 이동? 아니면 전체 종료?
-                                         # 로직: 각 언론사별로 중단되더라도 다른 언론사는 계속 해야 함.
-                                         # 여기서는 '모두 중복'이면 더 과거로 갈 필요가 있는가? 에 대한 결정이 필요.
-                                         # 보통 날짜별 기사는 독립적이므로 날짜를 계속 과거로 이동해야 함.
-                                         
-                for press_name, oid in self.press_dict.items():
-                    print(f"   - {press_name} (OID: {oid}) 탐색...")
-                    
-                    # 해당 언론사, 해당 날짜 크롤링 실행
-                    is_stopped = self.process_day_press(target_date_str, press_name, oid)
-                    
-                    if not is_stopped:
-                        all_press_stopped = False
-                
-                # 만약 날짜 제한 모드가 아니고(Incremental), 오늘 기사들이 모두 중복이라면?
-                # 즉, 과거의 모든 기사를 다 긁었다는 보장은 없으므로 날짜는 계속 줄여가야 함.
-                # 다만 until_date가 None일 때의 종료 조건이 모호할 수 있음.
-                # 사용자 의도: "중복 나오면 그만하고 싶다" -> 보통은 최근 날짜부터 하므로, 중복 나오면 '그 날짜'의 수집을 멈추고
-                # '그 전날'도 수집해야 하는가? -> Incremental은 보통 "마지막 수집일"까지 감.
-                # 본 로직은 until_date를 명시적으로 주는 것이 안전함.
+                # 모든 언론사 동시 수집 (언론사별 URL 공간이 독립적, 전체 요청 수는 FETCH_CONCURRENCY로 제한)
+                # 저장은 같은 이벤트 루프 안에서 save_row로 모이므로 파일 기록 주체는 하나로 유지됨
+                targets = list(active_press.items())
+                results = await asyncio.gather(*(
+                    self._process_press_staggered(i * PRESS_STAGGER_SEC, target_date_str, press_name, oid)
+                    for i, (press_name, oid) in enumerate(targets)
+                ))
+
+                # 하루치 수집분을 디스크에 확정 (북마크보다 데이터가 먼저 남도록)
+                self.sync_rows()
+
+                finished = []
+                for (press_name, oid), is_stopped in zip(targets, results):
+                    # Incremental 모드: 북마크(또는 중복)에 도달했거나, 북마크가 없는 신규 언론사는
+                    # 시작일 하루만 수집하고 종료 (과거 구간은 until_date를 지정해 채움)
+                    if self.limit_dt is None and (is_stopped or oid not in self._stop_at):
+                        finished.append((press_name, oid))
+
+                if finished:
+                    # 완료된 언론사만 북마크 반영 (동시 수집 중인 언론사가 중간에 끊겨도 구간이 누락되지 않도록)
+                    for press_name, oid in finished:
+                        if oid in self._pending_bookmarks:
+                            self._bookmarks[oid] = self._pending_bookmarks.pop(oid)
+                        del active_press[press_name]
+                    self.save_bookmarks()
                 
                 # 하루 전으로 이동
                 current_date -= timedelta(days=1)
+
+            if not active_press:
+                print("[종료] 모든 언론사가 최신 상태입니다.")
                 
-        except KeyboardInterrupt:
-            print("\n[사용자 중단] 크롤링을 강제 종료합니다.")
-        except Exception as e:
-            print(f"[시스템 오류] {e}")
         finally:
-            self.close()
+            await self.close_http_client()
 
 # ==============================================================================
 # [단독 실행 테스트]
@@ -1,9 +1,30 @@
 import os
+import functools
 import joblib
 import pandas as pd
 import numpy as np
 import sklearn 
 
+# 산업군 인코딩 (학습 시 사용한 매핑, 미등록 산업은 '기타'=3)
+INDUSTRY_CODES = {"건설": 0, "자동차": 1, "헬스케어": 2, "기타": 3}
+
+@functools.lru_cache(maxsize=1)
+def _load_predictor(model_path, scaler_path):
+    """
+    모델과 스케일러 로드 (프로세스당 한 번, 같은 경로면 캐시된 객체 재사용)
+    파일이 없으면 FileNotFoundError (예외는 캐시되지 않으므로 다음 생성 시 다시 시도)
+    """
+    # mmap_mode: 내부 numpy 배열을 메모리 매핑으로 읽어 여러 워커 프로세스가 페이지를 공유
+    model = joblib.load(model_path, mmap_mode='r')
+    # 상주하는 스케줄러 프로세스에서 예측마다 스레드를 띄우지 않도록 단일 스레드로 고정
+    if hasattr(model, 'n_jobs'):
+        model.n_jobs = 1
+    print(f"[Predictor] 모델 로드 완료: {os.path.basename(model_path)}")
+
+    scaler = joblib.load(scaler_path, mmap_mode='r')
+    print(f"[Predictor] 스케일러 로드 완료: {os.path.basename(scaler_path)}")
+    return model, scaler
+
 # ==============================================================================
 # [주가 등락 예측기 클래스 정의]
 # ==============================================================================
@@ -30,20 +51,11 @@ class DailyStockPredictor:
         self._load_resources()
 
     def _load_resources(self):
-        """모델과 스케일러를 안전하게 로드"""
+        """모델과 스케일러를 안전하게 로드 (디스크 읽기는 프로세스당 한 번, 이후 인스턴스는 캐시 공유)"""
         try:
-            if os.path.exists(self.model_path):
-                self.model = joblib.load(self.model_path)
-                print(f"[Predictor] 모델 로드 완료: {os.path.basename(self.model_path)}")
-            else:
-                print(f"[Predictor] 모델 파일 없음: {self.model_path}")
-
-            if os.path.exists(self.scaler_path):
-                self.scaler = joblib.load(self.scaler_path)
-                print(f"[Predictor] 스케일러 로드 완료: {os.path.basename(self.scaler_path)}")
-            else:
-                print(f"[Predictor] 스케일러 파일 없음: {self.scaler_path}")
-                
+            self.model, self.scaler = _load_predictor(self.model_path, self.scaler_path)
+        except FileNotFoundError as e:
+            print(f"[Predictor] 모델/스케일러 파일 없음: {e.filename}")
         except Exception as e:
             print(f"[Predictor] 리소스 로드 중 오류: {repr(e)}")
 
@@ -63,8 +75,7 @@ class DailyStockPredictor:
             
             # 산업군 인코딩 (Mapping)
             industry = data_row.get('INDUSTRY', '기타')
-            ind_map = {"건설": 0, "자동차": 1, "헬스케어": 2, "기타": 3}
-            ind_code = ind_map.get(industry, 3) # Default 3
+            ind_code = INDUSTRY_CODES.get(industry, 3) # Default 3
 
             # 피처 리스트 구성
             features = [
@@ -94,3 +105,52 @@ class DailyStockPredictor:
         except Exception as e:
             print(f"[Predictor] 예측 수행 실패: {e}")
             return None
+
+    def predict_batch(self, df):
+        """
+        여러 행을 한 번의 scaler/model 호출로 예측 (행마다 predict를 부르는 대신 사용)
+        
+        :param df: predict()의 data_row 키를 컬럼으로 갖는 DataFrame (INDUSTRY 컬럼이 없으면 '기타')
+        :return: 행 순서대로 0/1 예측값 배열(np.ndarray), 모델/스케일러가 없으면 None
+            - 피처에 NaN/inf가 있는 행(감성 점수 전부 누락 등)은 그 행만 -1 (predict()의 행 단위 실패와 동일)
+        """
+        if self.model is None or self.scaler is None:
+            return None
+        if df.empty:
+            return np.empty(0, dtype=int)
+
+        try:
+            # 산업군 인코딩 (컬럼 단위 매핑)
+            if 'INDUSTRY' in df.columns:
+                ind_code = df['INDUSTRY'].map(INDUSTRY_CODES).fillna(3).to_numpy()
+            else:
+                ind_code = np.full(len(df), 3)
+
+            # 피처 행렬 구성 (predict와 동일한 피처 순서)
+            X = np.column_stack([
+                df['ave_sent'].to_numpy(),
+                df['news_count'].to_numpy(),
+                ind_code,
+                df['close'].to_numpy(),
+                df['volume'].to_numpy(),
+                df['change'].to_numpy(),
+                df['total_news'].to_numpy(),
+                df['total_vol'].to_numpy(),
+                df['risk_index'].to_numpy(),
+                df['article_ratio'].to_numpy(),
+                df['volume_ratio'].to_numpy()
+            ]).astype(float)
+
+            # 유효한(모든 피처가 유한한) 행만 예측하고 나머지 행은 -1
+            preds = np.full(len(df), -1, dtype=int)
+            valid = np.isfinite(X).all(axis=1)
+            if not valid.all():
+                print(f"[Predictor] 피처 결측/무한대로 예측 제외: {int((~valid).sum())}개 행")
+            if valid.any():
+                X_scaled = self.scaler.transform(X[valid])
+                preds[valid] = self.model.predict(X_scaled).astype(int)
+            return preds
+
+        except Exception as e:
+            print(f"[Predictor] 배치 예측 수행 실패: {e}")
+            return np.full(len(df), -1, dtype=int)
@@ -2,11 +2,10 @@ import os
 import pandas as pd
 import numpy as np
 import datetime
-import cx_Oracle
+import oracledb
 from datetime import timedelta
 import sys
 from dotenv import load_dotenv
-from pydantic import BaseModel, ValidationError
 
 # ==============================================================================
 # [설정 및 환경변수 로드]
@@ -28,35 +27,35 @@ DB_HOST = os.getenv("DB_HOST", "localhost")
 DB_PORT = os.getenv("DB_PORT", "1521")
 DB_SERVICE = os.getenv("DB_SERVICE", "xe")
 
-# ==============================================================================
-# [데이터 모델 정의]
-# ==============================================================================
+# 뉴스 CSV에서 리스크 계산에 필요한 컬럼 / 스트리밍 청크 크기
+NEWS_COLUMNS = ['NDATE', 'TITLE', 'INDUSTRY', 'SENT_SCORE']
+CSV_CHUNK_SIZE = 100_000
 
-class RiskRecord(BaseModel):
-    """RISK 테이블 삽입 데이터 검증 모델"""
-    ID: int
-    RDATE: datetime.date
-    INDUSTRY: str
-    MEAN_SENT: float
-    RISK_INDEX: float
-    PREDICT: float
+# 커넥션 풀 (최초 사용 시 생성, thin 모드라 Oracle Client 불필요)
+_POOL = None
 
 # ==============================================================================
 # [핵심 로직]
 # ==============================================================================
 
+def get_pool():
+    """Oracle 커넥션 풀 반환 (없으면 생성)"""
+    global _POOL
+    if _POOL is None:
+        dsn = oracledb.makedsn(DB_HOST, DB_PORT, service_name=DB_SERVICE)
+        _POOL = oracledb.create_pool(user=DB_USER, password=DB_PASS, dsn=dsn, min=1, max=4, increment=1)
+    return _POOL
+
 def init_db():
-    """Oracle DB 연결 초기화"""
+    """Oracle DB 연결 획득 (풀에서 대여, close() 시 풀로 반환)"""
     try:
-        dsn = cx_Oracle.makedsn(DB_HOST, DB_PORT, service_name=DB_SERVICE)
-        conn = cx_Oracle.connect(user=DB_USER, password=DB_PASS, dsn=dsn)
-        return conn
+        return get_pool().acquire()
     except Exception as e:
         print(f"[오류] DB 연결 실패: {e}")
         raise e
 
 def ensure_risk_table(conn):
-    """RISK 테이블 존재 여부 확인 및 생성"""
+    """RISK 테이블 및 ID 시퀀스(RISK_ID_SEQ) 존재 여부 확인 및 생성"""
     create_sql = """
         CREATE TABLE RISK (
             ID NUMBER,
@@ -75,6 +74,14 @@ def ensure_risk_table(conn):
         if check == 0:
             print("[Risk] RISK 테이블 생성 중...")
             cursor.execute(create_sql)
+
+        cursor.execute("SELECT count(*) FROM user_sequences WHERE sequence_name = 'RISK_ID_SEQ'")
+        if cursor.fetchone()[0] == 0:
+            # 기존 행과 ID가 겹치지 않도록 현재 최대 ID 다음 값부터 시작 (생성 시 1회만 조회)
+            cursor.execute("SELECT NVL(MAX(ID), 0) + 1 FROM RISK")
+            start_id = int(cursor.fetchone()[0])
+            print("[Risk] RISK_ID_SEQ 시퀀스 생성 중...")
+            cursor.execute(f"CREATE SEQUENCE RISK_ID_SEQ START WITH {start_id} INCREMENT BY 1 CACHE 1000")
         cursor.close()
     except Exception as e:
         print(f"[오류] 테이블 확인/생성 실패: {e}")
@@ -93,11 +100,14 @@ def calculate_daily_risk(target_date):
     conn = init_db()
     ensure_risk_table(conn)
     cursor = conn.cursor()
+    cursor.arraysize = 500
     
     # 예측 모델 초기화
     predictor = DailyStockPredictor()
     
     date_str = target_date.strftime("%Y-%m-%d")
+    # RDATE 바인드 값 (date/datetime 어느 쪽이 와도 자정 기준 datetime으로 통일)
+    rdate = datetime.datetime(target_date.year, target_date.month, target_date.day)
     print(f"\n[Risk] {date_str} 리스크 분석 시작...")
     
     try:
@@ -111,12 +121,14 @@ def calculate_daily_risk(target_date):
             print(f"[오류] 뉴스 데이터 파일 없음: {csv_path}")
             return
 
-        df = pd.read_csv(csv_path)
-        
         # 날짜 필터링 (Format: YYYY-MM-DD)
-        # CSV의 'NDATE' 포맷에 따라 처리 (YYYY-MM-DD HH:MM:SS 가정 시 substring 사용)
-        df['NDATE_STR'] = df['NDATE'].astype(str).str.slice(0, 10)
-        daily_df = df[df['NDATE_STR'] == date_str]
+        # 전체 아카이브를 올리지 않고 필요한 컬럼만 청크 단위로 읽어 해당 날짜 행만 남김 (본문 컬럼은 읽지 않음)
+        # CSV의 'NDATE' 포맷에 따라 처리 (YYYY-MM-DD HH:MM:SS 가정 시 접두어 비교)
+        reader = pd.read_csv(csv_path, usecols=NEWS_COLUMNS, dtype={'NDATE': str}, chunksize=CSV_CHUNK_SIZE)
+        parts = [chunk[chunk['NDATE'].str.startswith(date_str, na=False)] for chunk in reader]
+        daily_df = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=NEWS_COLUMNS)
+        # 청크마다 dtype 추론이 다를 수 있으므로 감성 점수는 숫자로 통일
+        daily_df['SENT_SCORE'] = pd.to_numeric(daily_df['SENT_SCORE'], errors='coerce')
         
         if daily_df.empty:
             print(f"[알림] {date_str} 해당 날짜의 뉴스가 없습니다.")
@@ -127,10 +139,10 @@ def calculate_daily_risk(target_date):
         # ----------------------------------------------------------------------
         total_news_count = len(daily_df)
         
-        industry_stats = daily_df.groupby('INDUSTRY').agg({
-            'SENT_SCORE': 'mean',
-            'TITLE': 'count' # 뉴스 개수
-        }).rename(columns={'SENT_SCORE': 'mean_sent', 'TITLE': 'news_count'})
+        industry_stats = daily_df.groupby('INDUSTRY', as_index=False).agg(
+            mean_sent=('SENT_SCORE', 'mean'),
+            news_count=('TITLE', 'count') # 뉴스 개수
+        )
         
         # ----------------------------------------------------------------------
         # 3. 주식 데이터 로드 (DB)
@@ -140,8 +152,12 @@ def calculate_daily_risk(target_date):
             FROM STOCK
             WHERE SDATE = TO_DATE(:sdate, 'YYYY-MM-DD')
         """
-        cursor.execute(stock_query, {'sdate': date_str})
-        stock_rows = cursor.fetchall()
+        stock_cursor = conn.cursor()
+        stock_cursor.arraysize = 1000
+        stock_cursor.prefetchrows = 1000
+        stock_cursor.execute(stock_query, {'sdate': date_str})
+        stock_rows = stock_cursor.fetchall()
+        stock_cursor.close()
         
         if not stock_rows:
             print(f"[알림] {date_str} 주식 데이터가 없어 리스크 계산을 중단합니다.")
@@ -159,99 +175,77 @@ def calculate_daily_risk(target_date):
         }
         
         total_volume = stock_df['VOLUME'].sum()
-        
+
         # ----------------------------------------------------------------------
         # 4. 리스크 계산 및 예측
         # ----------------------------------------------------------------------
-        # RISK 테이블 PK (ID) 생성용
-        cursor.execute("SELECT MAX(ID) FROM RISK")
-        max_id_row = cursor.fetchone()
-        next_id = (max_id_row[0] if max_id_row and max_id_row[0] else 0) + 1
+        # 산업군 통계와 해당 시장 인덱스의 주식 데이터를 한 번에 결합 (매핑 없는 산업군/주식 데이터 없는 인덱스는 제외)
+        industry_stats['MARKET_INDEX'] = industry_stats['INDUSTRY'].map(market_map)
+        merged = industry_stats.dropna(subset=['MARKET_INDEX']).merge(
+            stock_df.drop_duplicates('MARKET_INDEX'), on='MARKET_INDEX', how='inner'
+        )
         
-        rows_to_insert = []
+        # 비율 계산 (Avoid Divide by Zero)
+        merged['news_ratio'] = merged['news_count'] / total_news_count if total_news_count > 0 else 0.0
+        merged['vol_ratio'] = merged['VOLUME'] / total_volume if total_volume > 0 else 0.0
         
-        for industry, row in industry_stats.iterrows():
-            if industry not in market_map:
-                continue
-                
-            market_idx = market_map[industry]
-            stock_data = stock_df[stock_df['MARKET_INDEX'] == market_idx]
-            
-            if stock_data.empty:
-                continue
-                
-            # 변수 추출
-            mean_sent = row['mean_sent']
-            news_count = row['news_count']
-            
-            close = stock_data.iloc[0]['CLOSE']
-            volume = stock_data.iloc[0]['VOLUME']
-            change = stock_data.iloc[0]['CHANGE']
-            
-            # 비율 계산 (Avoid Divide by Zero)
-            news_ratio = news_count / total_news_count if total_news_count > 0 else 0
-            vol_ratio = volume / total_volume if total_volume > 0 else 0
-            
-            # Risk Index Formula
-            # Risk = Mean_Sent * ln(1 + News_Ratio) * ln(1 + Vol_Ratio) * 1000 (Scaling)
-            risk_index = mean_sent * np.log1p(news_ratio) * np.log1p(vol_ratio) * 1000
-            
-            # ------------------------------------------------------------------
-            # 5. AI 예측 수행
-            # ------------------------------------------------------------------
-            pred_input = {
-                'ave_sent': mean_sent,
-                'news_count': news_count,
-                'close': close,
-                'volume': volume,
-                'change': change,
-                'total_news': total_news_count,
-                'total_vol': total_volume,
-                'risk_index': risk_index,
-                'article_ratio': news_ratio,
-                'volume_ratio': vol_ratio,
-                'INDUSTRY': industry # Optional depending on predictor logic
-            }
-            
-            prediction = predictor.predict(pred_input)
-            if prediction is None:
-                prediction = -1 # 예측 실패 시 -1
-                
-            # 데이터 검증 (Pydantic)
-            try:
-                record = RiskRecord(
-                    ID=next_id,
-                    RDATE=target_date.date(),
-                    INDUSTRY=industry,
-                    MEAN_SENT=float(mean_sent),
-                    RISK_INDEX=float(risk_index),
-                    PREDICT=float(prediction)
-                )
-                rows_to_insert.append(record)
-                next_id += 1
-            except ValidationError as e:
-                print(f"[경고] 데이터 검증 실패 ({industry}): {e}")
+        # Risk Index Formula (전 산업군 컬럼 단위 계산)
+        # Risk = Mean_Sent * ln(1 + News_Ratio) * ln(1 + Vol_Ratio) * 1000 (Scaling)
+        # Series 연산마다 붙는 인덱스 정렬을 피하도록 ndarray로 꺼내 한 번에 계산
+        mean_sent = merged['mean_sent'].to_numpy(dtype=np.float64)
+        news_ratio = merged['news_ratio'].to_numpy(dtype=np.float64)
+        vol_ratio = merged['vol_ratio'].to_numpy(dtype=np.float64)
+        merged['risk_index'] = mean_sent * np.log1p(news_ratio) * np.log1p(vol_ratio) * 1000
+        
+        # 예측 모델 입력 (산업군별 1행)
+        pred_inputs = pd.DataFrame({
+            'ave_sent': merged['mean_sent'],
+            'news_count': merged['news_count'],
+            'close': merged['CLOSE'],
+            'volume': merged['VOLUME'],
+            'change': merged['CHANGE'],
+            'total_news': total_news_count,
+            'total_vol': total_volume,
+            'risk_index': merged['risk_index'],
+            'article_ratio': merged['news_ratio'],
+            'volume_ratio': merged['vol_ratio'],
+            'INDUSTRY': merged['INDUSTRY'] # Optional depending on predictor logic
+        })
+        
+        # RISK 컬럼별 리스트 (행 객체 없이 그대로 executemany에 전달)
+        industries = merged['INDUSTRY'].tolist()
+        mean_sents = merged['mean_sent'].astype(float).tolist()
+        risk_indices = merged['risk_index'].astype(float).tolist()
+
+        # ----------------------------------------------------------------------
+        # 5. AI 예측 수행 (전 산업군 한 번에)
+        # ----------------------------------------------------------------------
+        predictions = predictor.predict_batch(pred_inputs) if industries else None
+        if predictions is None:
+            predictions = [-1] * len(industries) # 모델 미로드 시 전체 -1 (피처가 비정상인 행은 predict_batch가 행별로 -1)
+        predicts = [float(p) for p in predictions]
+
+        n_rows = len(industries)
+        rdates = [rdate] * n_rows
 
         # ----------------------------------------------------------------------
         # 6. DB 저장 (기존 데이터 삭제 후 삽입 - 멱등성 보장)
         # ----------------------------------------------------------------------
-        if rows_to_insert:
+        if n_rows:
             # 해당 날짜 데이터 삭제
             del_sql = "DELETE FROM RISK WHERE RDATE = TO_DATE(:rdate, 'YYYY-MM-DD')"
             cursor.execute(del_sql, {'rdate': date_str})
             
-            # 새 데이터 삽입
+            # 새 데이터 삽입 (PK는 RISK_ID_SEQ 시퀀스에서 서버가 발급)
             ins_sql = """
                 INSERT INTO RISK (ID, RDATE, INDUSTRY, MEAN_SENT, RISK_INDEX, PREDICT)
-                VALUES (:1, :2, :3, :4, :5, :6)
+                VALUES (RISK_ID_SEQ.NEXTVAL, :1, :2, :3, :4, :5)
             """
-            data_list = [
-                (r.ID, r.RDATE, r.INDUSTRY, r.MEAN_SENT, r.RISK_INDEX, r.PREDICT) 
-                for r in rows_to_insert
-            ]
-            cursor.executemany(ins_sql, data_list)
+            # 바인드 타입을 미리 지정하여 행마다 타입 추론 없이 배열 단위로 전송
+            cursor.setinputsizes(oracledb.DB_TYPE_DATE, 100, float, float, float)
+            cursor.executemany(ins_sql, list(zip(rdates, industries, mean_sents, risk_indices, predicts)))
             conn.commit()
-            print(f"[성공] {len(rows_to_insert)}건의 리스크/예측 데이터 저장 완료.")
+            print(f"[성공] {n_rows}건의 리스크/예측 데이터 저장 완료.")
         else:
             print("[알림] 저장할 리스크 데이터가 없습니다.")
 
@@ -1,11 +1,78 @@
 import os
+import hashlib
 import torch
 import numpy as np
 import pandas as pd
-import cx_Oracle
+import queue
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import oracledb
 from pydantic import BaseModel, ValidationError
 from transformers import AutoTokenizer, AutoModelForSequenceClassification
 
+# (선택) CPU 추론 가속용 ONNX Runtime - 미설치 시 PyTorch로 추론
+try:
+    import onnxruntime as ort
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+except ImportError:
+    ort = None
+
+# ==============================================================================
+# [설정]
+# ==============================================================================
+# analyze_db_news: 한 번에 가져와 분석/업데이트할 행 수, 커밋 주기(청크 수)
+DB_FETCH_SIZE = 256
+COMMIT_EVERY_CHUNKS = 4
+
+# 텍스트 해시 -> 감성 점수 LRU 캐시 최대 크기 (통신사 전재 기사 등 동일 텍스트 재추론 방지)
+SCORE_CACHE_MAX = 50_000
+
+# 파이프라인 단계 사이 큐 크기 (조회/추론/업데이트가 최대 2청크까지 앞서 나감)
+PIPELINE_QUEUE_SIZE = 2
+
+# 미분석 기사(SENT_SCORE IS NULL) 조회용 함수 기반 인덱스
+# NVL2(SENT_SCORE, NULL, 1)은 점수가 없는 행만 1이 되고 나머지는 NULL(인덱스 미포함)이므로
+# 인덱스 크기가 미분석 행 수에 비례하고, 조회가 전체 스캔 대신 limit 건의 인덱스 탐색으로 끝남
+# 인덱스 생성 DDL은 web/1stPrj_index.sql (없으면 힌트가 무시되고 전체 스캔으로 동작)
+SENT_NULL_INDEX = "IX_NEWS_SENT_NULL"
+
+# torch.compile 적용 시 배치 패딩 길이 단위 (입력 shape 종류를 64/128/192/256...으로 제한)
+PAD_TO_MULTIPLE = 64
+# torch.compile 워밍업 배치 크기 (호출부의 실제 배치 크기와 맞춤)
+WARMUP_BATCH_SIZE = 32
+
+# CPU 추론용 ONNX(INT8) 모델 저장 위치 (최초 1회 export/양자화 후 재사용)
+# 소스 트리 밖 캐시 디렉토리 사용 (SENTIMENT_ONNX_DIR 환경변수로 변경 가능)
+ONNX_DIR = os.environ.get("SENTIMENT_ONNX_DIR", os.path.join(os.path.expanduser("~"), ".cache", "sentiment_onnx"))
+
+# ==============================================================================
+# [파이프라인 큐 헬퍼] (다른 단계가 실패해 stop이 설정되면 대기하지 않고 빠져나옴)
+# ==============================================================================
+def _put_until_stopped(q, item, stop):
+    """큐에 item을 넣음. stop이 설정되면 포기하고 False 반환"""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=0.5)
+            return True
+        except queue.Full:
+            continue
+    return False
+
+def _get_until_stopped(q, stop):
+    """큐에서 항목을 꺼냄. stop이 설정되면 None(종료 신호) 반환"""
+    while True:
+        try:
+            return q.get(timeout=0.5)
+        except queue.Empty:
+            if stop.is_set():
+                return None
+
+def _lob_as_string(cursor, name, default_type, size, precision, scale):
+    """CLOB 컬럼을 LOB 로케이터 대신 문자열로 바로 받기 위한 outputtypehandler"""
+    if default_type == oracledb.DB_TYPE_CLOB:
+        return cursor.var(oracledb.DB_TYPE_LONG, arraysize=cursor.arraysize)
+
 # ==============================================================================
 # [데이터 모델 정의]
 # ==============================================================================
@@ -25,63 +92,254 @@ class NewsSentimentAnalyzer:
     [주요 기능]
     1. KoElectra 모델 로드 및 GPU/CPU 자동 설정
     2. 텍스트 배치를 입력받아 긍정/부정 점수(-1.0 ~ 1.0) 산출
-    3. DB에 저장된 뉴스 데이터를 조회하여 점수 업데이트 (V1 호환용, cx_Oracle 사용)
+    3. DB에 저장된 뉴스 데이터를 조회하여 점수 업데이트 (V1 호환용, python-oracledb 커넥션 풀 사용)
     """
     
-    def __init__(self, db_config=None, model_name="jaehyeong/koelectra-base-v3-generalized-sentiment-analysis"):
+    def __init__(self, db_config=None, model_name="jaehyeong/koelectra-base-v3-generalized-sentiment-analysis", max_length=256):
         """
         초기화 함수
         :param db_config: 오라클 DB 연결 설정 딕셔너리 (user, password, dsn 등). None이면 DB 기능 사용 불가.
         :param model_name: HuggingFace 모델명 (기본값: jaehyeong/koelectra...)
+        :param max_length: 기본 최대 토큰 길이 (기본값 256)
+            - 입력이 제목 + 본문 앞 200~300자(약 180토큰 내외)라 256이면 대부분 잘리지 않음
+            - 어텐션 연산은 길이의 제곱에 비례하므로 512 대비 긴 입력에서 최대 약 4배 절감
+            - 본문 전체를 분석할 때는 predict_batch(max_length=512)로 지정
         """
         self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
         self.db_config = db_config
         self.model_name = model_name
+        self.max_length = max_length
+        self._pool = None
+        self._score_cache = OrderedDict()  # (max_length, blake2b(text)) -> score
+        # 입력 텐서 전송 인자 (배치마다 dict를 새로 만들지 않도록 캐시)
+        self._to_kwargs = {"device": self.device, "non_blocking": True}
+        # GPU 전송용 pinned 입력 버퍼 {(슬롯, 입력명): 1차원 int64 텐서} - 배치마다 재할당하지 않고 재사용
+        self._pinned_bufs = {}
+        # 배치 패딩 길이 단위 (torch.compile 적용 시에만 PAD_TO_MULTIPLE, 아니면 배치 내 최대 길이)
+        self._pad_multiple = None
+        self.ort_session = None
         
         print(f"[감성분석] 모델 로딩: {model_name} (장치: {self.device})...")
         try:
-            self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-            self.model = AutoModelForSequenceClassification.from_pretrained(model_name).to(self.device)
+            self.tokenizer = AutoTokenizer.from_pretrained(model_name, use_fast=True)
+            # GPU에서는 FP16 가중치로 바로 로드 (Tensor Core 활용, 활성값 메모리 절반)
+            # low_cpu_mem_usage: 가중치를 한 번만 할당하여 로딩 시 최대 메모리 사용량 감소
+            dtype = torch.float16 if self.device.type == "cuda" else torch.float32
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                model_name,
+                torch_dtype=dtype,
+                low_cpu_mem_usage=True
+            ).to(self.device)
             self.model.eval() # 추론 모드 설정
+            if self.device.type != "cuda":
+                self._init_onnx()
+            if self.ort_session is None:
+                self._compile_model()
             print("[감성분석] 모델 로드 완료.")
         except Exception as e:
             print(f"[오류] 모델 초기화 실패: {e}")
             raise e
 
-    def predict_batch(self, texts, batch_size=32):
+    def _init_onnx(self):
+        """
+        [CPU 전용] 모델을 ONNX로 export 후 동적 INT8 양자화하여 ONNX Runtime 세션 생성
+        onnxruntime 미설치 또는 export/양자화 실패 시 PyTorch 추론을 그대로 사용합니다.
+        """
+        if ort is None:
+            return
+
+        base = os.path.join(ONNX_DIR, self.model_name.replace("/", "__"))
+        fp32_path = base + ".onnx"
+        int8_path = base + ".int8.onnx"
+        try:
+            if not os.path.exists(int8_path):
+                print("[감성분석] ONNX INT8 모델 생성 중 (최초 1회)...")
+                os.makedirs(ONNX_DIR, exist_ok=True)
+                input_names = list(self.tokenizer.model_input_names)
+                dummy = self.tokenizer(["감성 분석 더미 입력"], return_tensors="pt")
+                dynamic_axes = {name: {0: "batch", 1: "seq"} for name in input_names}
+                dynamic_axes["logits"] = {0: "batch"}
+                torch.onnx.export(
+                    self.model,
+                    (dict((name, dummy[name]) for name in input_names),),
+                    fp32_path,
+                    input_names=input_names,
+                    output_names=["logits"],
+                    dynamic_axes=dynamic_axes,
+                    opset_version=17
+                )
+                try:
+                    quantize_dynamic(fp32_path, int8_path, weight_type=QuantType.QInt8)
+                finally:
+                    # 양자화 입력으로만 쓰는 FP32 중간 파일 삭제 (수백 MB, 실패 시에도 남기지 않음)
+                    if os.path.exists(fp32_path):
+                        os.remove(fp32_path)
+
+            self.ort_session = ort.InferenceSession(int8_path, providers=["CPUExecutionProvider"])
+            self._ort_input_names = [i.name for i in self.ort_session.get_inputs()]
+            print("[감성분석] ONNX Runtime (INT8) 추론 사용.")
+        except Exception as e:
+            print(f"[감성분석] ONNX Runtime 미적용 (PyTorch로 추론): {e}")
+            self.ort_session = None
+
+    def _compile_model(self, batch_size=WARMUP_BATCH_SIZE):
+        """
+        torch.compile로 forward 그래프를 컴파일하고 실제 배치 크기/패딩 길이로 미리 워밍업합니다.
+        - 기본 모드 + dynamic=True: 배치 크기/길이가 달라도 하나의 동적 shape 그래프를 재사용
+          (reduce-overhead의 CUDA 그래프는 shape마다 새로 기록되어 길이 버킷팅과 맞지 않음)
+        - 배치는 PAD_TO_MULTIPLE 단위로 패딩되므로 워밍업도 그 길이들로 수행
+        - 배치 크기 1은 별도 그래프로 특수화되므로 워밍업은 실제 배치 크기로 수행
+        컴파일/워밍업 중 오류가 나면 기존(eager) 모델을 그대로 사용합니다.
+        """
+        if not hasattr(torch, "compile"):
+            return
+
+        eager_model = self.model
+        try:
+            self.model = torch.compile(eager_model, dynamic=True, fullgraph=False)
+            with torch.inference_mode():
+                for length in range(PAD_TO_MULTIPLE, self.max_length + PAD_TO_MULTIPLE, PAD_TO_MULTIPLE):
+                    dummy = {
+                        name: torch.ones((batch_size, length), dtype=torch.long, device=self.device)
+                        for name in self.tokenizer.model_input_names
+                    }
+                    if "token_type_ids" in dummy:
+                        dummy["token_type_ids"].zero_()
+                    self.model(**dummy)
+            self._pad_multiple = PAD_TO_MULTIPLE
+            print("[감성분석] torch.compile 적용 완료.")
+        except Exception as e:
+            print(f"[감성분석] torch.compile 미적용 (기본 모드로 실행): {e}")
+            self.model = eager_model
+            self._pad_multiple = None
+
+    def predict_batch(self, texts, batch_size=32, max_length=None):
         """
         [배치 추론] 다수의 텍스트 리스트에 대해 감성 점수를 반환합니다.
         
         :param texts: 분석할 텍스트 리스트
         :param batch_size: 한 번에 처리할 텍스트 수
-        :return: 감성 점수 리스트 (범위: -1.0 ~ 1.0)
+        :param max_length: 최대 토큰 길이 (None이면 생성자의 max_length, 초과분은 잘림)
+        :return: 감성 점수 배열 (np.ndarray float32, 범위: -1.0 ~ 1.0)
         """
-        all_scores = []
-        
+        # 문자열이 아닌 항목만 한 번 변환 (DB/CSV 경로는 이미 str이라 그대로 통과)
+        texts = [t if isinstance(t, str) else str(t) for t in texts]
+        if not texts:
+            return np.empty(0, dtype=np.float32)
+
+        max_length = max_length or self.max_length
+
+        # 중복 텍스트/이전에 분석한 텍스트는 캐시에서 가져오고, 처음 보는 고유 텍스트만 모델에 입력
+        # (잘리는 길이에 따라 점수가 달라지므로 max_length도 키에 포함)
+        cache = self._score_cache
+        keys = [(max_length, hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest()) for t in texts]
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in cache and key not in pending:
+                pending[key] = text
+        if pending:
+            for key, score in zip(pending, self._predict_texts(list(pending.values()), batch_size, max_length).tolist()):
+                cache[key] = score
+
+        all_scores = np.fromiter((cache[key] for key in keys), dtype=np.float32, count=len(keys))
+
+        # LRU 갱신 및 초과분 제거
+        for key in keys:
+            cache.move_to_end(key)
+        while len(cache) > SCORE_CACHE_MAX:
+            cache.popitem(last=False)
+        return all_scores
+
+    def _pinned_buffer(self, slot, name, numel):
+        """슬롯/입력명별 pinned 버퍼 반환 (필요한 크기보다 작을 때만 새로 할당)"""
+        buf = self._pinned_bufs.get((slot, name))
+        if buf is None or buf.numel() < numel:
+            buf = torch.empty(numel, dtype=torch.long, pin_memory=True)
+            self._pinned_bufs[(slot, name)] = buf
+        return buf
+
+    def _predict_texts(self, texts, batch_size, max_length):
+        """
+        predict_batch의 실제 모델 추론부 (캐시 미적중 고유 텍스트만 입력됨)
+        :return: 입력 순서대로의 감성 점수 배열 (np.ndarray float32)
+        """
+        # 전체 텍스트를 한 번에 토크나이징 (패딩은 배치별로 수행)
+        encoded = self.tokenizer(
+            texts,
+            truncation=True,
+            max_length=max_length
+        )
+        keys = list(encoded.keys())
+
+        # 토큰 길이 순으로 정렬해 배치를 구성 (배치 내 길이가 비슷해져 패딩 토큰 연산 감소)
+        lengths = [len(ids) for ids in encoded["input_ids"]]
+        order = np.argsort(lengths, kind="stable")
+        all_scores = np.empty(len(texts), dtype=np.float32)
+        pin = self.device.type == "cuda"
+        # pinned 버퍼 2벌을 번갈아 사용 (한 슬롯이 GPU로 복사되는 동안 다른 슬롯에 다음 배치를 채움)
+        copy_done = [None, None]
+        # 패딩 후 최대 길이 (torch.compile 적용 시 PAD_TO_MULTIPLE 배수로 올림)
+        pad_multiple = self._pad_multiple
+        padded_max = -(-max_length // pad_multiple) * pad_multiple if pad_multiple else max_length
+
+        def prepare(start, slot):
+            # 배치 내 최대 길이로 동적 패딩 (GPU 사용 시 재사용 pinned 버퍼에 담아 비동기 복사 가능하게)
+            batch_idx = order[start:start+batch_size]
+            inputs = self.tokenizer.pad(
+                {k: [encoded[k][j] for j in batch_idx] for k in keys},
+                pad_to_multiple_of=pad_multiple,
+                return_tensors="pt"
+            )
+            if not pin:
+                return dict(inputs)
+            if copy_done[slot] is not None:
+                copy_done[slot].synchronize()  # 이 슬롯의 이전 배치 전송이 끝난 뒤에 덮어씀
+            pinned = {}
+            for k, v in inputs.items():
+                rows, cols = v.shape
+                view = self._pinned_buffer(slot, k, batch_size * padded_max)[:rows * cols].view(rows, cols)
+                view.copy_(v)
+                pinned[k] = view
+            return pinned
+
         # GPU 메모리 효율을 위해 배치 단위로 처리
-        for i in range(0, len(texts), batch_size):
-            batch_texts = [str(t) for t in texts[i:i+batch_size]]
-            
-            # 토크나이징
-            inputs = self.tokenizer(
-                batch_texts, 
-                return_tensors="pt", 
-                padding=True, 
-                truncation=True, 
-                max_length=512
-            ).to(self.device)
-            
-            with torch.no_grad():
-                outputs = self.model(**inputs)
-                probs = torch.nn.functional.softmax(outputs.logits, dim=-1)
-                
-                # 모델 출력: [부정확률, 긍정확률]
-                # 점수 = 긍정 - 부정 (1.0 가까울수록 긍정, -1.0 가까울수록 부정)
-                scores = (probs[:, 1] - probs[:, 0]).cpu().numpy()
-                all_scores.extend(scores)
-                
+        # 다음 배치의 패딩은 별도 스레드에서 미리 준비하고, 점수는 GPU에 모아 마지막에 한 번만 동기화
+        batch_scores = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(prepare, 0, 0)
+            for n, i in enumerate(range(0, len(texts), batch_size)):
+                slot = n % 2
+                inputs = future.result()
+                if i + batch_size < len(texts):
+                    future = executor.submit(prepare, i + batch_size, 1 - slot)
+                inputs = {k: v.to(**self._to_kwargs) for k, v in inputs.items()}
+                if pin:
+                    copy_done[slot] = torch.cuda.Event()
+                    copy_done[slot].record()
+
+                with torch.inference_mode():
+                    if self.ort_session is not None:
+                        # CPU: ONNX Runtime INT8 세션으로 추론
+                        ort_inputs = {name: inputs[name].numpy() for name in self._ort_input_names}
+                        logits = torch.from_numpy(self.ort_session.run(None, ort_inputs)[0])
+                    else:
+                        logits = self.model(**inputs).logits
+                    # 모델 출력: [부정, 긍정] 로짓 (FP16 로짓은 FP32로 올려서 계산)
+                    # 점수 = P(긍정) - P(부정) = tanh((긍정 로짓 - 부정 로짓) / 2)
+                    # (2클래스 softmax 차이와 동일한 값, 1.0 가까울수록 긍정, -1.0 가까울수록 부정)
+                    logits = logits.float()
+                    batch_scores.append(torch.tanh(0.5 * (logits[:, 1] - logits[:, 0])))
+
+        # 정렬 순서대로 이어 붙인 점수를 원래 위치에 기록
+        all_scores[order] = torch.cat(batch_scores).cpu().numpy()
         return all_scores
 
+    def _get_pool(self):
+        """Oracle 커넥션 풀 반환 (최초 DB 작업 시 생성, 이후 호출에서는 재사용)"""
+        if self._pool is None:
+            self._pool = oracledb.create_pool(**self.db_config, min=1, max=4, increment=1)
+        return self._pool
+
     def analyze_db_news(self, limit=100):
         """
         [DB 전용 메서드] 
@@ -94,58 +352,123 @@ class NewsSentimentAnalyzer:
             return 0
             
         try:
-            conn = cx_Oracle.connect(**self.db_config)
+            # 조회 스레드와 업데이트 스레드가 동시에 DB를 쓰므로 커넥션을 분리 (풀에서 대여, close() 시 반환)
+            pool = self._get_pool()
+            conn = pool.acquire()
+            update_conn = pool.acquire()
             cursor = conn.cursor()
+            cursor.arraysize = 1000
+            cursor.prefetchrows = 1000
+            cursor.outputtypehandler = _lob_as_string
+            update_cursor = update_conn.cursor()
 
-            # 1. 대상 데이터 조회 (SENT_SCORE IS NULL)
-            select_sql = """
-                SELECT LINK, TITLE, CONTENT 
-                FROM NEWS 
-                WHERE SENT_SCORE IS NULL 
+            # 1. 대상 데이터 조회 (SENT_SCORE IS NULL) - 전체를 한 번에 올리지 않고 청크 단위로 스트리밍
+            # (인덱스 식과 동일한 NVL2 조건을 써야 함수 기반 인덱스를 탐)
+            # 본문은 분석에 쓰는 앞 300자만 DB에서 잘라서 전송
+            select_sql = f"""
+                SELECT /*+ INDEX(n {SENT_NULL_INDEX}) */ LINK, TITLE, SUBSTR(CONTENT, 1, 300) 
+                FROM NEWS n
+                WHERE NVL2(SENT_SCORE, NULL, 1) = 1 
                 FETCH FIRST :limit ROWS ONLY
             """
+            # (점수, 링크) 배열을 한 번의 MERGE로 반영 (행 단위 오류는 batcherrors로 수집)
+            update_sql = """
+                MERGE INTO NEWS n
+                USING (SELECT :1 AS score, :2 AS link FROM dual) s
+                ON (n.LINK = s.link)
+                WHEN MATCHED THEN UPDATE SET n.SENT_SCORE = s.score
+            """
             cursor.execute(select_sql, {"limit": limit})
-            rows = cursor.fetchall()
-            
-            if not rows:
+
+            # 조회(스레드) -> 추론(메인 스레드, GPU) -> 업데이트(스레드) 파이프라인
+            # GPU가 N번째 청크를 처리하는 동안 N+1번째 청크 조회와 N-1번째 청크 업데이트가 함께 진행됨
+            text_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            update_q = queue.Queue(maxsize=PIPELINE_QUEUE_SIZE)
+            stop = threading.Event()
+            errors = []
+
+            def fetch_worker():
+                # 2. 데이터 준비 (제목 + 본문 앞 300자(SQL에서 잘림)를 합쳐서 분석 텍스트 생성)
+                try:
+                    while not stop.is_set():
+                        rows = cursor.fetchmany(DB_FETCH_SIZE)
+                        if not rows:
+                            break
+                        links = [link for link, _, _ in rows]
+                        # NULL 제목/본문은 빈 문자열로 (행마다 모델 객체를 만들지 않고 바로 처리)
+                        texts = [f"{title or ''} {content or ''}" for _, title, content in rows]
+                        if not _put_until_stopped(text_q, (links, texts), stop):
+                            return
+                except Exception as e:
+                    errors.append(e)
+                    stop.set()
+                _put_until_stopped(text_q, None, stop)
+
+            def update_worker():
+                # 3. DB 반영 + 4. 주기적 커밋 (종료 신호를 받으면 마지막 커밋)
+                chunks = 0
+                try:
+                    while True:
+                        data = _get_until_stopped(update_q, stop)
+                        if data is None:
+                            break
+                        update_cursor.executemany(update_sql, data, batcherrors=True)
+                        # 실패한 행만 기록하고 배치의 나머지는 그대로 반영
+                        for err in update_cursor.getbatcherrors():
+                            print(f"[경고] 감성 점수 반영 실패 (LINK={data[err.offset][1]}): {err.message}")
+                        chunks += 1
+                        if chunks % COMMIT_EVERY_CHUNKS == 0:
+                            update_conn.commit()
+                    if not stop.is_set():
+                        update_conn.commit()
+                except Exception as e:
+                    errors.append(e)
+                    stop.set()
+
+            fetcher = threading.Thread(target=fetch_worker, daemon=True)
+            updater = threading.Thread(target=update_worker, daemon=True)
+            fetcher.start()
+            updater.start()
+
+            updated = 0
+            try:
+                while True:
+                    item = _get_until_stopped(text_q, stop)
+                    if item is None:
+                        break
+                    links, texts = item
+                    if updated == 0:
+                        print("[감성분석] 기사 분석 시작...")
+
+                    # 배치 추론 (tolist()로 한 번에 numpy float32 -> python float 변환)
+                    scores = self.predict_batch(texts, batch_size=16, max_length=256)
+                    if not _put_until_stopped(update_q, list(zip(scores.astype(np.float64).tolist(), links)), stop):
+                        break
+                    updated += len(links)
+                _put_until_stopped(update_q, None, stop)
+            except Exception:
+                stop.set()
+                raise
+            finally:
+                fetcher.join()
+                updater.join()
+
+            if errors:
+                raise errors[0]
+
+            if updated == 0:
                 print("[감성분석] 분석할 대상 기사가 없습니다.")
                 return 0
-                
-            print(f"[감성분석] {len(rows)}개 기사 분석 시작...")
-            
-            # 2. 데이터 준비 및 분석 (제목 + 본문 앞부분 조합)
-            update_data = []
-            texts_to_analyze = []
-            links = []
-            
-            for row in rows:
-                link, title, content = row
-                # 제목과 본문 앞 300자를 합쳐서 분석 텍스트 생성
-                text_input = f"{title} {content[:300]}"
-                texts_to_analyze.append(text_input)
-                links.append(link)
-                
-            # 배치 추론
-            scores = self.predict_batch(texts_to_analyze, batch_size=16)
-            
-            # 3. DB 업데이트 준비
-            update_sql = "UPDATE NEWS SET SENT_SCORE = :score WHERE LINK = :link"
-            
-            for link, score in zip(links, scores):
-                # float 형변환 중요 (numpy float to python float)
-                update_data.append((float(score), link))
-                
-            # 4. DB 반영
-            cursor.executemany(update_sql, update_data)
-            conn.commit()
-            
-            print(f"[감성분석] {len(update_data)}개 기사 감성 점수 업데이트 완료.")
-            return len(update_data)
+
+            print(f"[감성분석] {updated}개 기사 감성 점수 업데이트 완료.")
+            return updated
 
         except Exception as e:
             print(f"[오류] DB 감성 분석 실패: {e}")
-            if 'conn' in locals(): conn.rollback()
+            if 'update_conn' in locals(): update_conn.rollback()
             return 0
         finally:
+            if 'update_cursor' in locals(): update_cursor.close()
             if 'cursor' in locals(): cursor.close()
+            if 'update_conn' in locals(): update_conn.close()
             if 'conn' in locals(): conn.close()
@@ -0,0 +1,11 @@
+-- 1stPrj.sql 테이블 생성 후 1회 실행하는 인덱스 마이그레이션
+-- 결합 조회(get_combined_data)용 인덱스
+-- RISK: 산업군 일치 + 날짜 조인 / STOCK: 기간 범위 후 MARKET_INDEX(LIKE) 필터를 인덱스에서 처리
+-- RISK는 조인 조건 TRIM(r.INDUSTRY)와 같은 식의 함수 기반 인덱스 (공백이 섞인 값도 조인됨)
+CREATE INDEX risk_ind_date ON RISK (TRIM(INDUSTRY), RDATE) COMPRESS 1;
+CREATE INDEX stock_date_mi ON STOCK (SDATE, MARKET_INDEX);
+
+-- 감성분석(analyze_db_news) 미분석 기사 조회용 함수 기반 인덱스
+-- SENT_SCORE가 NULL인 행만 인덱스에 포함 (크기가 미분석 행 수에 비례)
+-- ONLINE: 생성 중에도 크롤러의 NEWS INSERT/UPDATE를 막지 않음
+CREATE INDEX IX_NEWS_SENT_NULL ON NEWS (NVL2(SENT_SCORE, NULL, 1)) ONLINE;
@@ -7,24 +7,46 @@
   python app.py
 """
 
-from flask import Flask, render_template, request, jsonify
+from flask import Flask, render_template, request, jsonify, Response, stream_with_context
 from database.repository import (
-    get_industries, 
-    get_date_range, 
-    get_combined_data
+    get_dashboard_bundle,
+    get_combined_data,
+    iter_combined_data,
+    get_dashboard_async,
+    rows_to_dicts,
+    clear_cache
 )
 from models import SearchParams
 from datetime import datetime, timedelta
+import hmac
 import json
+import os
 
 app = Flask(__name__)
 app.config["SECRET_KEY"] = "stock_visualization_2025"
+# 캐시 무효화 API 토큰 (.env의 CACHE_CLEAR_TOKEN, 미설정 시 로컬 요청만 허용)
+app.config["CACHE_CLEAR_TOKEN"] = os.getenv("CACHE_CLEAR_TOKEN")
+
+def to_json_payload(df):
+    """get_combined_data 결과(DataFrame) -> JSON 직렬화 가능한 dict"""
+    # 시리즈는 컬럼 단위로 리스트 변환, raw_data는 행별 컬럼명 dict
+    return {
+        'dates': df['trade_date'].tolist(),
+        'closes': df['close'].tolist(),
+        'article_ratios': df['article_ratio'].tolist(),
+        'trade_volume_ratios': df['trade_volume_ratio'].tolist(),
+        'mean_sents': df['mean_sent'].tolist(),
+        'risk': df['risk'].tolist(),
+        'predicts': df['predict'].tolist(),
+        'raw_data': rows_to_dicts(df)
+    }
 
 @app.route("/")
 def index():
     """메인 페이지 - 검색 폼"""
-    industries = get_industries()
-    min_date, max_date = get_date_range()
+    bundle = get_dashboard_bundle()
+    industries = bundle['industries']
+    min_date, max_date = bundle['min_date'], bundle['max_date']
     
     # 기본값: 최근 30일
     default_end = max_date
@@ -73,8 +95,8 @@ def visualization():
 
     # 데이터 조회
     try:
-        data = get_combined_data(start_date, end_date, industry, market_index)
-        print(f"[DEBUG] 조회된 데이터 개수: {len(data['dates'])}개")
+        df = get_combined_data(start_date, end_date, industry, market_index)
+        print(f"[DEBUG] 조회된 데이터 개수: {len(df)}개")
     except Exception as e:
         print(f"[ERROR] 데이터 조회 오류: {e}")
         import traceback
@@ -82,7 +104,7 @@ def visualization():
         return f"데이터 조회 오류: {e}", 500
     
     # 데이터가 없는 경우
-    if not data['dates']:
+    if df.empty:
         return render_template(
             "stock/no_data.html",
             start_date=start_date,
@@ -97,13 +119,13 @@ def visualization():
         end_date=end_date,
         industry=industry,
         market_index=market_index,
-        dates=json.dumps(data['dates']),
-        closes=json.dumps(data['closes']),
-        article_ratios=json.dumps(data['article_ratios']),
-        trade_volume_ratios=json.dumps(data['trade_volume_ratios']),
-        mean_sents=json.dumps(data['mean_sents']),
-        risk=json.dumps(data['risk']),
-        predicts=json.dumps(data['predicts'])
+        dates=json.dumps(df['trade_date'].tolist()),
+        closes=json.dumps(df['close'].to_numpy().tolist()),
+        article_ratios=json.dumps(df['article_ratio'].to_numpy().tolist()),
+        trade_volume_ratios=json.dumps(df['trade_volume_ratio'].to_numpy().tolist()),
+        mean_sents=json.dumps(df['mean_sent'].to_numpy().tolist()),
+        risk=json.dumps(df['risk'].to_numpy().tolist()),
+        predicts=json.dumps(df['predict'].to_numpy().tolist())
     )
 
 @app.route("/api/data")
@@ -119,10 +141,69 @@ def api_data():
     
     try:
         data = get_combined_data(start_date, end_date, industry, market_index)
-        return jsonify(data)
+        return jsonify(to_json_payload(data))
+    except Exception as e:
+        return jsonify({"error": str(e)}), 500
+
+@app.route("/api/dashboard")
+async def api_dashboard():
+    """
+    API 엔드포인트 - 산업군 목록/날짜 범위 + 결합 데이터를 한 번에 반환
+    (비동기 뷰: 두 DB 조회를 동시에 수행, flask[async] 필요)
+    """
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    industry = request.args.get('industry')
+    market_index = request.args.get('market_index', industry)
+
+    if not all([start_date, end_date, industry]):
+        return jsonify({"error": "필수 파라미터 누락"}), 400
+
+    try:
+        result = await get_dashboard_async(start_date, end_date, industry, market_index)
+        payload = to_json_payload(result['data'])
+        payload.update(result['bundle'])
+        return jsonify(payload)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+@app.route("/api/data/stream")
+def api_data_stream():
+    """
+    API 엔드포인트 - 장기간 데이터를 청크 단위 NDJSON으로 스트리밍
+    (한 줄 = /api/data와 같은 형태의 청크 하나)
+    """
+    start_date = request.args.get('start_date')
+    end_date = request.args.get('end_date')
+    industry = request.args.get('industry')
+    market_index = request.args.get('market_index', 'KOSPI')
+
+    if not all([start_date, end_date, industry]):
+        return jsonify({"error": "필수 파라미터 누락"}), 400
+
+    def generate():
+        for chunk in iter_combined_data(start_date, end_date, industry, market_index):
+            yield json.dumps(to_json_payload(chunk), ensure_ascii=False) + "\n"
+
+    return Response(stream_with_context(generate()), mimetype="application/x-ndjson")
+
+@app.route("/api/cache/clear", methods=["POST"])
+def api_cache_clear():
+    """
+    조회 캐시 무효화 (DB 적재 직후 최신 데이터를 바로 보려면 호출)
+    외부에서 임의로 캐시를 비워 DB 부하를 유발하지 못하도록
+    X-Cache-Token 헤더가 CACHE_CLEAR_TOKEN과 일치해야 함 (토큰 미설정 시 로컬 요청만 허용)
+    """
+    token = app.config["CACHE_CLEAR_TOKEN"]
+    if token:
+        allowed = hmac.compare_digest(request.headers.get("X-Cache-Token", ""), token)
+    else:
+        allowed = request.remote_addr in ("127.0.0.1", "::1")
+    if not allowed:
+        return jsonify({"error": "권한 없음"}), 403
+    clear_cache()
+    return jsonify({"status": "cleared"})
+
 @app.errorhandler(404)
 def page_not_found(error):
     """404 에러 핸들러"""
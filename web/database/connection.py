@@ -1,4 +1,4 @@
-import cx_Oracle
+import oracledb
 import os
 from dotenv import load_dotenv
 
@@ -11,14 +11,22 @@ ORACLE_USER = os.getenv('ORACLE_USER')
 ORACLE_PASSWORD = os.getenv('ORACLE_PASSWORD')
 ORACLE_SERVICE = os.getenv('ORACLE_SERVICE', 'xe')
 
-# Oracle 연결
+# Oracle 커넥션 풀 (요청마다 pool.acquire()로 대여, with 블록 종료 시 반환)
+# max는 동시 처리 워커 수에 맞춰 조정
+# stmtcachesize: 세션별 문장 캐시 크기 - 같은 SQL 재실행 시 재파싱 없이 커서 재사용
+# (repository의 고정 SQL 수보다 넉넉하게 지정, 풀의 모든 세션에 적용)
 try:
-    conn = cx_Oracle.connect(
-        ORACLE_USER,
-        ORACLE_PASSWORD,
-        f"{DBSERVER_IP}:{ORACLE_PORT}/{ORACLE_SERVICE}"
+    pool = oracledb.create_pool(
+        user=ORACLE_USER,
+        password=ORACLE_PASSWORD,
+        dsn=f"{DBSERVER_IP}:{ORACLE_PORT}/{ORACLE_SERVICE}",
+        min=5,
+        max=50,
+        increment=2,
+        getmode=oracledb.POOL_GETMODE_WAIT,
+        stmtcachesize=32
     )
-    print("[DB] Connection established successfully")
-except cx_Oracle.DatabaseError as e:
-    print(f"[DB ERROR] Connection failed: {e}")
+    print("[DB] Connection pool created successfully")
+except oracledb.DatabaseError as e:
+    print(f"[DB ERROR] Connection pool creation failed: {e}")
     raise
@@ -1,24 +1,123 @@
-from database.connection import conn
-from typing import List, Dict, Tuple
-from datetime import datetime
+from database.connection import pool
+from typing import List, Dict, Tuple, Iterator
+from datetime import datetime, timedelta
+import asyncio
+import functools
+import inspect
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import threading
+import time
 
+# ==============================================================================
+# [조회 결과 캐시]
+# ==============================================================================
+# 산업군 목록/날짜 범위는 하루 1회 배치로만 바뀌므로 짧은 TTL 동안 재사용
+META_CACHE_TTL = 300
+# 기간/산업군별 결합 데이터 캐시 (최근 조회 조합 최대 256개)
+DATA_CACHE_TTL = 300
+DATA_CACHE_MAX = 256
+
+_cached_functions = []
+
+# get_combined_data 결과 컬럼명 (COMBINED_SQL SELECT 순서, 소문자)
+# 조회할 때마다 cursor.description에서 만들지 않고 상수로 고정
+_COMBINED_KEYS = (
+    'trade_date', 'close', 'change', 'volume', 'mean_sent', 'risk', 'predict',
+    'total_news', 'article_ratio', 'risk_volume', 'trade_volume_ratio'
+)
+
+# get_combined_data DataFrame 컬럼 타입 (trade_date는 'YYYY-MM-DD' 문자열)
+# 정수 컬럼(거래량/기사 수)은 int64로 유지하여 JSON 출력도 정수로 나가게 함
+_COMBINED_DTYPES = {
+    'close': np.float64,
+    'change': np.float64,
+    'volume': np.int64,
+    'mean_sent': np.float64,
+    'risk': np.float64,
+    'predict': np.float64,
+    'total_news': np.int64,
+    'article_ratio': np.float64,
+    'risk_volume': np.int64,
+    'trade_volume_ratio': np.float64,
+}
+
+# 행 튜플 -> 컬럼명 dict 변환 함수를 모듈 로드 시 한 번 생성
+# {'trade_date': r[0], 'close': r[1], ...} 리터럴로 컴파일되어 zip/_asdict()보다 빠름
+_ns = {}
+exec(
+    "def _row_to_dict(r): return {"
+    + ", ".join(f"{k!r}: r[{i}]" for i, k in enumerate(_COMBINED_KEYS))
+    + "}",
+    _ns
+)
+_row_to_dict = _ns.pop('_row_to_dict')
+del _ns
+
+def rows_to_dicts(df: pd.DataFrame) -> List[Dict]:
+    """get_combined_data DataFrame -> 행별 컬럼명 dict 리스트 (JSON 응답용)"""
+    return list(map(_row_to_dict, df.itertuples(index=False, name=None)))
+
+def ttl_cache(ttl: int, maxsize: int = 128):
+    """
+    인자 조합별 결과를 ttl초 동안 보관하는 캐시 데코레이터
+    maxsize를 넘으면 가장 오래 전에 저장된 항목부터 제거 (clear_cache()로 전체 무효화)
+    위치/키워드 인자는 함수 시그니처로 정규화하여 같은 호출이면 같은 키를 사용
+    """
+    def decorator(func):
+        entries = {}  # 정규화된 인자 -> (만료 시각, 결과)
+        lock = threading.Lock()
+        sig = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # 기본값까지 채워 f(a, b)와 f(a, b=..)가 같은 키가 되도록 함
+            bound = sig.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = bound.args + tuple(sorted(bound.kwargs.items()))
+            now = time.monotonic()
+            with lock:
+                hit = entries.get(key)
+                if hit is not None and hit[0] > now:
+                    return hit[1]
+            result = func(*bound.args, **bound.kwargs)
+            with lock:
+                entries.pop(key, None)
+                entries[key] = (now + ttl, result)
+                while len(entries) > maxsize:
+                    entries.pop(next(iter(entries)))
+            return result
+
+        def cache_clear():
+            with lock:
+                entries.clear()
+
+        wrapper.cache_clear = cache_clear
+        _cached_functions.append(wrapper)
+        return wrapper
+    return decorator
+
+def clear_cache() -> None:
+    """모든 조회 캐시 무효화 (배치 적재 직후 등)"""
+    for func in _cached_functions:
+        func.cache_clear()
+
+@ttl_cache(META_CACHE_TTL, maxsize=1)
 def get_industries() -> List[str]:
     """모든 산업군 목록 조회"""
-    cursor = conn.cursor()
-    try:
+    with pool.acquire() as conn, conn.cursor() as cursor:
         sql = "SELECT DISTINCT INDUSTRY FROM RISK ORDER BY INDUSTRY"
         cursor.execute(sql)
         result = cursor.fetchall()
         industries = [row[0] for row in result]
         print(f"[DEBUG] get_industries() 결과: {industries}")
         return industries
-    finally:
-        cursor.close()
 
+@ttl_cache(META_CACHE_TTL, maxsize=1)
 def get_date_range() -> Tuple[str, str]:
     """데이터의 날짜 범위 조회"""
-    cursor = conn.cursor()
-    try:
+    with pool.acquire() as conn, conn.cursor() as cursor:
         sql = """
             SELECT 
                 TO_CHAR(MIN(SDATE), 'YYYY-MM-DD') AS min_date,
@@ -29,160 +128,144 @@ def get_date_range() -> Tuple[str, str]:
         result = cursor.fetchone()
         print(f"[DEBUG] get_date_range() 결과: {result[0]} ~ {result[1]}")
         return result[0], result[1]
-    finally:
-        cursor.close()
 
-def get_stock_data(start_date: str, end_date: str, market_index: str = '자동차') -> List[Dict]:
-    """STOCK 테이블에서 기간별 데이터 조회"""
-    cursor = conn.cursor()
-    try:
+@ttl_cache(META_CACHE_TTL, maxsize=1)
+def get_dashboard_bundle() -> Dict:
+    """
+    메인 페이지용 메타데이터(산업군 목록 + 날짜 범위)를 한 번의 쿼리로 조회
+    SRC 컬럼으로 행 종류를 구분하여 UNION ALL로 묶음 (왕복 2회 -> 1회)
+    :return: {'industries': [...], 'min_date': 'YYYY-MM-DD', 'max_date': 'YYYY-MM-DD'}
+    """
+    with pool.acquire() as conn, conn.cursor() as cursor:
         sql = """
+            SELECT 'INDUSTRY' AS SRC, INDUSTRY AS V1, NULL AS V2
+            FROM (SELECT DISTINCT INDUSTRY FROM RISK)
+            UNION ALL
             SELECT 
-                TO_CHAR(SDATE, 'YYYY-MM-DD') AS sdate,
-                MARKET_INDEX,
-                CLOSE,
-                CHANGE,
-                VOLUME
+                'RANGE' AS SRC,
+                TO_CHAR(MIN(SDATE), 'YYYY-MM-DD') AS V1,
+                TO_CHAR(MAX(SDATE), 'YYYY-MM-DD') AS V2
             FROM STOCK
-            WHERE SDATE BETWEEN TO_DATE(:start_date, 'YYYY-MM-DD') 
-                            AND TO_DATE(:end_date, 'YYYY-MM-DD')
-                AND MARKET_INDEX = :market_index
-            ORDER BY SDATE
         """
-        print(f"[DEBUG] get_stock_data() 파라미터:")
-        print(f"  - start_date: {start_date}")
-        print(f"  - end_date: {end_date}")
-        print(f"  - market_index: '{market_index}'")
-
-        cursor.execute(sql, {
-            'start_date': start_date,
-            'end_date': end_date,
-            'market_index': market_index
-        })
-        result = cursor.fetchall()
-        print(f"[DEBUG] get_stock_data() 결과: {len(result)}개 행")
-
-        keys = [desc[0].lower() for desc in cursor.description]
-        return [dict(zip(keys, row)) for row in result]
-    finally:
-        cursor.close()
+        cursor.execute(sql)
+        industries = []
+        min_date = max_date = None
+        for src, v1, v2 in cursor.fetchall():
+            if src == 'INDUSTRY':
+                industries.append(v1)
+            else:
+                min_date, max_date = v1, v2
+        industries.sort()
+        print(f"[DEBUG] get_dashboard_bundle() 결과: 산업군 {industries}, 기간 {min_date} ~ {max_date}")
+        return {'industries': industries, 'min_date': min_date, 'max_date': max_date}
 
-def get_risk_data(start_date: str, end_date: str, industry: str) -> List[Dict]:
-    """RISK 테이블에서 산업별, 기간별 데이터 조회"""
-    cursor = conn.cursor()
-    try:
-        sql = """
-            SELECT 
-                TO_CHAR(RDATE, 'YYYY-MM-DD') AS rdate,
-                INDUSTRY,
-                MEAN_SENT,
-                RISK,
-                PREDICT,
-                TOTAL_NEWS,
-                ARTICLE_RATIO,
-                TOTAL_VOLUME,
-                TRADE_VOLUME_RATIO
-            FROM RISK
-            WHERE RDATE BETWEEN TO_DATE(:start_date, 'YYYY-MM-DD') 
-                            AND TO_DATE(:end_date, 'YYYY-MM-DD')
-            AND INDUSTRY = :industry
-            ORDER BY RDATE
-        """
-        print(f"[DEBUG] get_risk_data() 파라미터:")
-        print(f"  - start_date: {start_date}")
-        print(f"  - end_date: {end_date}")
-        print(f"  - industry: '{industry}'")
+# STOCK + RISK 결합 조회
+# 인덱스 (1stPrj_index.sql): STOCK(SDATE, MARKET_INDEX), RISK(TRIM(INDUSTRY), RDATE)
+# (저장된 INDUSTRY 앞뒤 공백과 무관하게 조인되도록 TRIM을 유지하고 같은 식으로 인덱싱)
+# 기간 범위로 STOCK을 먼저 읽고 날짜별로 RISK를 인덱스 탐색(NL 조인)
+# 숫자 컬럼은 NVL(.., 0)로 NULL(LEFT JOIN 미매칭 포함)을 0으로 바꿔 반환 -> 파이썬에서 NULL 처리 불필요
+COMBINED_SQL = """
+    SELECT /*+ LEADING(s r) INDEX(s stock_date_mi) INDEX(r risk_ind_date) USE_NL(r) */
+        s.SDATE AS TRADE_DATE,
+        NVL(s.CLOSE, 0) AS CLOSE,
+        NVL(s.CHANGE, 0) AS CHANGE,
+        NVL(s.VOLUME, 0) AS VOLUME,
+        NVL(r.MEAN_SENT, 0) AS MEAN_SENT,
+        NVL(r.RISK, 0) AS RISK,
+        NVL(r.PREDICT, 0) AS PREDICT,
+        NVL(r.TOTAL_NEWS, 0) AS TOTAL_NEWS,
+        NVL(r.ARTICLE_RATIO, 0) AS ARTICLE_RATIO,
+        NVL(r.TOTAL_VOLUME, 0) AS RISK_VOLUME,
+        NVL(r.TRADE_VOLUME_RATIO, 0) AS TRADE_VOLUME_RATIO
+    FROM STOCK s
+    LEFT JOIN RISK r
+        ON s.SDATE = r.RDATE
+        AND TRIM(r.INDUSTRY) = :industry
+    WHERE s.SDATE >= :start_date AND s.SDATE < :end_date_next
+    AND s.MARKET_INDEX LIKE '%' || TRIM(:market_index) || '%'
+    ORDER BY s.SDATE
+"""
 
-        cursor.execute(sql, {
-            'start_date': start_date,
-            'end_date': end_date,
-            'industry': industry
-        })
-        result = cursor.fetchall()
-        print(f"[DEBUG] get_risk_data() 결과: {len(result)}개 행")
+def _combined_binds(start_date: str, end_date: str, industry: str, market_index: str) -> Dict:
+    """COMBINED_SQL 바인드 값"""
+    # 날짜는 DATE 타입으로 바인드 (컬럼에 TO_CHAR를 씌우지 않아 SDATE 인덱스 사용 가능)
+    # 종료일 당일 포함: SDATE < 종료일 + 1일
+    return {
+        'start_date': datetime.strptime(start_date, '%Y-%m-%d'),
+        'end_date_next': datetime.strptime(end_date, '%Y-%m-%d') + timedelta(days=1),
+        'industry': industry.strip(),  # TRIM(r.INDUSTRY)와 비교하므로 바인드 값도 공백 제거
+        'market_index': market_index
+    }
 
-        keys = [desc[0].lower() for desc in cursor.description]
-        return [dict(zip(keys, row)) for row in result]
-    finally:
-        cursor.close()
+def _to_frame(odf) -> pd.DataFrame:
+    """
+    fetch_df_all/fetch_df_batches 결과(Arrow 컬럼 데이터) -> pandas DataFrame
+    컬럼: _COMBINED_KEYS, 날짜는 'YYYY-MM-DD' 문자열
+    """
+    # 드라이버가 채운 Arrow 컬럼 버퍼를 그대로 변환 (행 튜플/파이썬 객체 생성 없음)
+    df = pa.table(odf).to_pandas()
+    df.columns = list(_COMBINED_KEYS)
+    df['trade_date'] = df['trade_date'].dt.strftime('%Y-%m-%d')
+    # NULL은 SQL(NVL)에서 이미 0으로 바뀌어 오므로 타입만 고정
+    return df.astype(_COMBINED_DTYPES)
 
-def get_combined_data(start_date: str, end_date: str, industry: str, market_index: str = '자동차') -> Dict:
-    """STOCK과 RISK 데이터를 결합하여 조회"""
-    cursor = conn.cursor()
-    try:
-        sql = """
-            SELECT 
-                TO_CHAR(s.SDATE, 'YYYY-MM-DD') AS TRADE_DATE,
-                s.CLOSE,
-                s.CHANGE,
-                s.VOLUME,
-                r.MEAN_SENT,
-                r.RISK,
-                r.PREDICT,
-                r.TOTAL_NEWS,
-                r.ARTICLE_RATIO,
-                r.TOTAL_VOLUME AS RISK_VOLUME,
-                r.TRADE_VOLUME_RATIO
-            FROM STOCK s
-            LEFT JOIN RISK r
-                ON TO_CHAR(s.SDATE, 'YYYY-MM-DD') = TO_CHAR(r.RDATE, 'YYYY-MM-DD')
-                AND TRIM(r.INDUSTRY) = TRIM(:industry)
-            WHERE TO_CHAR(s.SDATE, 'YYYY-MM-DD')
-                BETWEEN :start_date AND :end_date
-            AND s.MARKET_INDEX LIKE '%' || TRIM(:market_index) || '%'
-            ORDER BY s.SDATE
-        """
+@ttl_cache(DATA_CACHE_TTL, maxsize=DATA_CACHE_MAX)
+def get_combined_data(start_date: str, end_date: str, industry: str, market_index: str = '자동차') -> pd.DataFrame:
+    """
+    STOCK과 RISK 데이터를 결합하여 조회
+    컬럼이 _COMBINED_KEYS(trade_date, close, risk, ...)인 DataFrame 반환 (날짜순)
+    시리즈는 df['close'].to_numpy() 등으로 사용
+    (결과는 캐시되어 호출자 간 공유되므로 반환값을 수정하지 말 것)
+    """
+    with pool.acquire() as conn:
         print(f"[DEBUG] get_combined_data() 파라미터:")
         print(f"  - start_date: {start_date}")
         print(f"  - end_date: {end_date}")
         print(f"  - industry: '{industry}'")
         print(f"  - market_index: '{market_index}'")
 
-        cursor.execute(sql, {
-            'start_date': start_date,
-            'end_date': end_date,
-            'industry': industry,
-            'market_index': market_index
-        })
-        result = cursor.fetchall()
-        print(f"[DEBUG] get_combined_data() SQL 실행 결과: {len(result)}개 행")
+        # 결과를 Arrow 컬럼 형식으로 직접 조회 (fetch 배열 크기를 키워 왕복 최소화)
+        odf = conn.fetch_df_all(
+            COMBINED_SQL,
+            _combined_binds(start_date, end_date, industry, market_index),
+            arraysize=10_000
+        )
+        df = _to_frame(odf)
+        print(f"[DEBUG] get_combined_data() SQL 실행 결과: {len(df)}개 행")
 
-        keys = [desc[0].lower() for desc in cursor.description]
-        data_list = [dict(zip(keys, row)) for row in result]
-        
-        if data_list:
+        if not df.empty:
             print(f"[DEBUG] 첫 번째 행 샘플:")
-            print(f"  {data_list[0]}")
-
-        # 데이터 분리
-        dates = [row['trade_date'] for row in data_list]
-        closes = [float(row['close']) if row['close'] else 0 for row in data_list]
-        article_ratios = [float(row['article_ratio']) if row['article_ratio'] else 0 for row in data_list]
-        trade_volume_ratios = [float(row['trade_volume_ratio']) if row['trade_volume_ratio'] else 0 for row in data_list]
-        mean_sents = [float(row['mean_sent']) if row['mean_sent'] else 0 for row in data_list]
-        risk = [float(row['risk']) if row['risk'] else 0 for row in data_list]
-        predicts = [float(row['predict']) if row['predict'] else 0 for row in data_list]
-        
-        result_dict = {
-            'dates': dates,
-            'closes': closes,
-            'article_ratios': article_ratios,
-            'trade_volume_ratios': trade_volume_ratios,
-            'mean_sents': mean_sents,
-            'risk': risk,
-            'predicts': predicts,
-            'raw_data': data_list
-        }
-        
-        print(f"[DEBUG] 반환 데이터 요약:")
-        print(f"  - dates: {len(dates)}개")
-        print(f"  - closes: {len(closes)}개")
-        print(f"  - risk: {len(risk)}개")
-        
-        return result_dict    
-
-    finally:
-        cursor.close()
+            print(f"  {df.iloc[0].to_dict()}")
+
+        return df
+
+def iter_combined_data(start_date: str, end_date: str, industry: str, market_index: str = '자동차',
+                       chunk_size: int = 5000) -> Iterator[pd.DataFrame]:
+    """
+    get_combined_data의 스트리밍 버전 (장기간 조회용, 캐시하지 않음)
+    chunk_size 행씩 가져와 get_combined_data와 같은 형태의 DataFrame을 청크마다 yield
+    전체 결과를 메모리에 올리지 않으므로 최대 메모리가 청크 크기에 비례
+    """
+    with pool.acquire() as conn:
+        for odf in conn.fetch_df_batches(
+            COMBINED_SQL,
+            _combined_binds(start_date, end_date, industry, market_index),
+            size=chunk_size
+        ):
+            yield _to_frame(odf)
+
+async def get_dashboard_async(start_date: str, end_date: str, industry: str, market_index: str = '자동차') -> Dict:
+    """
+    대시보드 데이터(메타데이터 + 결합 데이터)를 동시에 조회
+    두 조회를 각각 풀 커넥션으로 워커 스레드에서 실행하고 asyncio.gather로 기다려 DB 왕복 시간이 겹치게 함
+    :return: {'bundle': get_dashboard_bundle() 결과, 'data': get_combined_data() 결과}
+    """
+    bundle, data = await asyncio.gather(
+        asyncio.to_thread(get_dashboard_bundle),
+        asyncio.to_thread(get_combined_data, start_date, end_date, industry, market_index)
+    )
+    return {'bundle': bundle, 'data': data}
+
 
 if __name__ == "__main__":
     # 테스트
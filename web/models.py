@@ -2,21 +2,27 @@
 # models.py
 
 from pydantic import BaseModel, Field
+from dataclasses import dataclass
 from typing import Optional
 from datetime import date
 
-class StockData(BaseModel):
+# 조회 결과 행 모델: DB에서 이미 타입이 정해진 값을 담기만 하므로 검증 없는 가벼운 dataclass 사용
+# (frozen: 불변, slots: 인스턴스 dict 없음 -> 생성/메모리 비용 최소화)
+# 외부 입력 검증이 필요한 곳(SearchParams)만 pydantic 사용
+
+@dataclass(frozen=True, slots=True)
+class StockData:
     """주식 데이터 모델"""
-    id: Optional[int] = None
     sdate: date
     market_index: str
     close: float
     change: float
     volume: int
+    id: Optional[int] = None
 
-class RiskData(BaseModel):
+@dataclass(frozen=True, slots=True)
+class RiskData:
     """리스크 데이터 모델"""
-    id: Optional[int] = None
     rdate: date
     industry: str
     mean_sent: float
@@ -26,6 +32,7 @@ class RiskData(BaseModel):
     article_ratio: float
     total_volume: int
     trade_volume_ratio: float
+    id: Optional[int] = None
 
 class SearchParams(BaseModel):
     """검색 파라미터 모델"""
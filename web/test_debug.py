@@ -1,94 +1,87 @@
-from database.connection import conn
+from database.connection import pool
 
-# 1. STOCK 테이블의 MARKET_INDEX 값 확인
-print("=" * 50)
-print("STOCK 테이블 MARKET_INDEX 값 확인")
-print("=" * 50)
-cursor = conn.cursor()
+# 풀에서 커넥션 하나를 빌려 점검 전체에 사용
+conn = pool.acquire()
+
+# 네 가지 점검 쿼리를 UNION ALL로 묶어 한 번에 조회 (DB 왕복 4회 -> 1회)
+# SEC: 점검 구분(1~4), SORT_KEY: 구분 내 정렬 기준, C1~C5: 구분별 출력 값
 sql = """
-    SELECT DISTINCT 
-        MARKET_INDEX,
-        LENGTH(MARKET_INDEX) AS 길이,
-        DUMP(MARKET_INDEX) AS 바이트정보
-    FROM STOCK
-    ORDER BY MARKET_INDEX
+    SELECT SEC, SORT_KEY, C1, C2, C3, C4, C5 FROM (
+        -- 1. STOCK 테이블의 MARKET_INDEX 값 확인
+        SELECT 1 AS SEC, MARKET_INDEX AS SORT_KEY,
+               MARKET_INDEX AS C1, TO_CHAR(LENGTH(MARKET_INDEX)) AS C2, DUMP(MARKET_INDEX) AS C3,
+               NULL AS C4, NULL AS C5
+        FROM (SELECT DISTINCT MARKET_INDEX FROM STOCK)
+        UNION ALL
+        -- 2. RISK 테이블의 INDUSTRY 값 확인
+        SELECT 2, INDUSTRY,
+               INDUSTRY, TO_CHAR(LENGTH(INDUSTRY)), DUMP(INDUSTRY),
+               NULL, NULL
+        FROM (SELECT DISTINCT INDUSTRY FROM RISK)
+        UNION ALL
+        -- 3. 날짜 범위 확인
+        SELECT 3, '1',
+               'STOCK', TO_CHAR(MIN(SDATE), 'YYYY-MM-DD'), TO_CHAR(MAX(SDATE), 'YYYY-MM-DD'),
+               TO_CHAR(COUNT(*)), NULL
+        FROM STOCK
+        UNION ALL
+        SELECT 3, '2',
+               'RISK', TO_CHAR(MIN(RDATE), 'YYYY-MM-DD'), TO_CHAR(MAX(RDATE), 'YYYY-MM-DD'),
+               TO_CHAR(COUNT(*)), NULL
+        FROM RISK
+        UNION ALL
+        -- 4. 샘플 데이터로 JOIN 테스트
+        SELECT 4, TO_CHAR(s.SDATE, 'YYYY-MM-DD'),
+               TO_CHAR(s.SDATE, 'YYYY-MM-DD'), s.MARKET_INDEX, r.INDUSTRY,
+               TO_CHAR(s.CLOSE), TO_CHAR(r.RISK)
+        FROM STOCK s
+        LEFT JOIN RISK r
+            ON s.SDATE = r.RDATE
+            AND TRIM(r.INDUSTRY) = TRIM(s.MARKET_INDEX)  -- 공백 차이로 인한 불일치 점검용이므로 TRIM 유지
+        WHERE s.SDATE BETWEEN TO_DATE('2025-09-30', 'YYYY-MM-DD')
+                          AND TO_DATE('2025-10-02', 'YYYY-MM-DD')
+        AND s.MARKET_INDEX LIKE '%건설%'
+    )
+    ORDER BY SEC, SORT_KEY
 """
+cursor = conn.cursor()
 cursor.execute(sql)
+sections = {1: [], 2: [], 3: [], 4: []}
 for row in cursor.fetchall():
-    print(f"값: '{row[0]}' | 길이: {row[1]} | 바이트: {row[2]}")
+    sections[row[0]].append(row[2:])
 cursor.close()
 
+# 1. STOCK 테이블의 MARKET_INDEX 값 확인
+print("=" * 50)
+print("STOCK 테이블 MARKET_INDEX 값 확인")
+print("=" * 50)
+for row in sections[1]:
+    print(f"값: '{row[0]}' | 길이: {row[1]} | 바이트: {row[2]}")
+
 # 2. RISK 테이블의 INDUSTRY 값 확인
 print("\n" + "=" * 50)
 print("RISK 테이블 INDUSTRY 값 확인")
 print("=" * 50)
-cursor = conn.cursor()
-sql = """
-    SELECT DISTINCT 
-        INDUSTRY,
-        LENGTH(INDUSTRY) AS 길이,
-        DUMP(INDUSTRY) AS 바이트정보
-    FROM RISK
-    ORDER BY INDUSTRY
-"""
-cursor.execute(sql)
-for row in cursor.fetchall():
+for row in sections[2]:
     print(f"값: '{row[0]}' | 길이: {row[1]} | 바이트: {row[2]}")
-cursor.close()
 
 # 3. 날짜 범위 확인
 print("\n" + "=" * 50)
 print("날짜 범위 확인")
 print("=" * 50)
-cursor = conn.cursor()
-sql = """
-    SELECT 
-        'STOCK' AS 테이블,
-        TO_CHAR(MIN(SDATE), 'YYYY-MM-DD') AS 시작일,
-        TO_CHAR(MAX(SDATE), 'YYYY-MM-DD') AS 종료일,
-        COUNT(*) AS 행수
-    FROM STOCK
-    UNION ALL
-    SELECT 
-        'RISK' AS 테이블,
-        TO_CHAR(MIN(RDATE), 'YYYY-MM-DD') AS 시작일,
-        TO_CHAR(MAX(RDATE), 'YYYY-MM-DD') AS 종료일,
-        COUNT(*) AS 행수
-    FROM RISK
-"""
-cursor.execute(sql)
-for row in cursor.fetchall():
+for row in sections[3]:
     print(f"{row[0]} | {row[1]} ~ {row[2]} | 총 {row[3]}행")
-cursor.close()
 
 # 4. 샘플 데이터로 JOIN 테스트
 print("\n" + "=" * 50)
 print("JOIN 테스트 (2025-09-30 ~ 2025-10-02, 건설)")
 print("=" * 50)
-cursor = conn.cursor()
-sql = """
-    SELECT 
-        TO_CHAR(s.SDATE, 'YYYY-MM-DD') AS 날짜,
-        s.MARKET_INDEX AS STOCK_산업,
-        r.INDUSTRY AS RISK_산업,
-        s.CLOSE,
-        r.RISK
-    FROM STOCK s
-    LEFT JOIN RISK r
-        ON TO_CHAR(s.SDATE, 'YYYY-MM-DD') = TO_CHAR(r.RDATE, 'YYYY-MM-DD')
-        AND TRIM(r.INDUSTRY) = TRIM(s.MARKET_INDEX)
-    WHERE s.SDATE BETWEEN TO_DATE('2025-09-30', 'YYYY-MM-DD') 
-                      AND TO_DATE('2025-10-02', 'YYYY-MM-DD')
-    AND s.MARKET_INDEX LIKE '%건설%'
-    ORDER BY s.SDATE
-"""
-cursor.execute(sql)
-result = cursor.fetchall()
-if result:
-    for row in result:
+if sections[4]:
+    for row in sections[4]:
         print(f"{row[0]} | STOCK: '{row[1]}' | RISK: '{row[2]}' | CLOSE: {row[3]} | RISK: {row[4]}")
 else:
     print("데이터 없음!")
-cursor.close()
+
+conn.close()
 
 print("\n완료!")